@@ -7,7 +7,7 @@ and sets up the primary signal/slot connections for the MVC pattern.
 import logging
 from typing import Optional
 from PyQt6.QtCore import QObject, pyqtSignal
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import QSystemTrayIcon
 
 from models.application_model import ApplicationStateModel
 from models.script_models import ScriptCollectionModel, ScriptExecutionModel, HotkeyModel
@@ -69,7 +69,6 @@ class AppController(QObject):
             self._script_collection.discover_scripts()
             
             # Set up tray system availability
-            from PyQt6.QtWidgets import QSystemTrayIcon
             self._tray_model.set_supports_notifications(QSystemTrayIcon.supportsMessages())
             
             self.application_initialized.emit()
@@ -7,8 +7,7 @@ coordinating between settings models and the settings view.
 import logging
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-from PyQt6.QtCore import QObject, pyqtSignal
-from PyQt6.QtWidgets import QFileDialog, QMessageBox
+from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
 logger = logging.getLogger('Controllers.Settings')
 
@@ -49,8 +48,55 @@ class SettingsController(QObject):
         # Track current settings state
         self._current_settings = {}
         
+        # Discovered scripts, cached until the collection rediscovers them
+        self._scripts_cache: Optional[List[Any]] = None
+        self._display_name_by_stem: Optional[Dict[str, str]] = None
+        self._scripts_with_stems: Optional[List[Tuple[Any, str]]] = None
+        self._script_collection.scripts_discovered.connect(self._invalidate_scripts_cache)
+        
+        # Coalesces script list reloads requested within one event-loop turn
+        self._script_list_update_pending = False
+        
         logger.info("SettingsController initialized")
     
+    # Script cache
+    def _get_scripts(self, force: bool = False) -> List[Any]:
+        """Return all scripts (including disabled), cached for this controller."""
+        if force or self._scripts_cache is None:
+            self._scripts_cache = self._script_collection.get_all_scripts()
+            self._display_name_by_stem = None
+            self._scripts_with_stems = None
+        return self._scripts_cache
+    
+    def _get_scripts_with_stems(self) -> List[Tuple[Any, str]]:
+        """Return (script_info, file stem) pairs, resolving each path's stem once."""
+        scripts = self._get_scripts()
+        if self._scripts_with_stems is None:
+            self._scripts_with_stems = [(s, s.file_path.stem) for s in scripts]
+        return self._scripts_with_stems
+    
+    def _invalidate_scripts_cache(self, *args):
+        """Drop cached scripts after the collection rediscovers them."""
+        self._scripts_cache = None
+        self._display_name_by_stem = None
+        self._scripts_with_stems = None
+    
+    def _schedule_script_list_update(self):
+        """Emit script_list_updated once for a burst of script changes."""
+        if self._script_list_update_pending:
+            return
+        self._script_list_update_pending = True
+        QTimer.singleShot(0, self._emit_script_list_update)
+    
+    def _emit_script_list_update(self):
+        """Reload script configurations and send them to the view."""
+        self._script_list_update_pending = False
+        try:
+            self.script_list_updated.emit(self._load_script_configurations())
+        except Exception as e:
+            logger.error(f"Error refreshing script list: {e}")
+            self.error_occurred.emit("Load Error", f"Failed to refresh scripts: {str(e)}")
+    
     # Loading methods
     def load_all_settings(self):
         """Load all current settings from models"""
@@ -85,16 +131,19 @@ class SettingsController(QObject):
         """Load script configurations including enable/disable state"""
         configs = []
         
-        # Get all scripts (including disabled ones)
-        all_scripts = self._script_collection.get_all_scripts()
+        # Get all scripts (including disabled ones); the file stem identifies
+        # a script for settings/hotkeys
+        all_scripts = self._get_scripts_with_stems()
+        # Read the custom_names group once instead of twice per script
+        custom_names = self._settings_manager.get_all_custom_names()
         
-        for script_info in all_scripts:
-            # Use the file stem as the script identifier for settings/hotkeys
-            stem_name = script_info.file_path.stem
-            # Effective name (custom applied) for display to users
-            effective_display_name = self._script_collection.get_script_display_name(script_info)
+        for script_info, stem_name in all_scripts:
             # Original base display name from analyzer (stable identifier for model APIs)
             original_display_name = script_info.display_name
+            # Custom names are stored against the original display name
+            custom_name = custom_names.get(original_display_name) or None
+            # Effective name (custom applied) for display to users
+            effective_display_name = custom_name or original_display_name
 
             config = {
                 'name': stem_name,  # file stem identifier for settings/hotkeys
@@ -103,8 +152,7 @@ class SettingsController(QObject):
                 'is_external': self._script_collection.is_external_script(original_display_name),
                 'is_disabled': self._script_collection.is_script_disabled(original_display_name),
                 'hotkey': self._hotkey_model.get_hotkey_for_script(stem_name),
-                # Custom names are stored against the original display name
-                'custom_name': self._settings_manager.get_custom_name(original_display_name),
+                'custom_name': custom_name,
                 'has_arguments': bool(script_info.arguments),
                 'arguments': script_info.arguments if script_info.arguments else [],
                 'file_path': str(script_info.file_path)
@@ -118,10 +166,13 @@ class SettingsController(QObject):
         """Load all script presets keyed by display name for the view."""
         presets: Dict[str, Dict[str, Any]] = {}
 
-        all_scripts = self._script_collection.get_all_scripts()
-        for script_info in all_scripts:
-            # Settings are stored under the file stem, but the view uses display names
-            stem_name = script_info.file_path.stem
+        all_scripts = self._get_scripts_with_stems()
+        # List the preset groups once so scripts without presets cost no settings reads
+        stems_with_presets = set(self._settings_manager.get_preset_script_names())
+        # Settings are stored under the file stem, but the view uses display names
+        for script_info, stem_name in all_scripts:
+            if stem_name not in stems_with_presets:
+                continue
             display_name = script_info.display_name
             script_presets = self._settings_manager.get_script_presets(stem_name)
             if script_presets:
@@ -186,7 +237,7 @@ class SettingsController(QObject):
                 self._script_controller.disable_script(script_name)
             
             # Refresh script list
-            self.script_list_updated.emit(self._load_script_configurations())
+            self._schedule_script_list_update()
             
         except Exception as e:
             logger.error(f"Error toggling script {script_name}: {e}")
@@ -231,14 +282,21 @@ class SettingsController(QObject):
             # Map the file stem to the current display name
             display_name = self._get_display_name_for_stem(script_name) or script_name
 
-            if custom_name and custom_name.strip() and custom_name != display_name:
+            stripped = custom_name.strip() if custom_name else ''
+            if stripped and stripped != display_name:
+                if stripped == self._settings_manager.get_custom_name(display_name):
+                    # Already stored; skip the write and the script list reload
+                    return
                 self._settings_manager.set_custom_name(display_name, custom_name)
             else:
+                if self._settings_manager.get_custom_name(display_name) is None:
+                    # No mapping to remove; the display name is unchanged
+                    return
                 # Remove custom name mapping (revert to original)
                 self._settings_manager.remove_custom_name(display_name)
 
             # Refresh script list so the view reflects updated display names
-            self.script_list_updated.emit(self._load_script_configurations())
+            self._schedule_script_list_update()
 
         except Exception as e:
             logger.error(f"Error setting custom name for {script_name}: {e}")
@@ -262,7 +320,7 @@ class SettingsController(QObject):
             script_name = path.stem.replace('_', ' ').title()
             
             # Check for duplicates
-            existing_scripts = self._script_collection.get_all_scripts()
+            existing_scripts = self._get_scripts()
             for script in existing_scripts:
                 if script.display_name == script_name:
                     self.error_occurred.emit(
@@ -276,7 +334,7 @@ class SettingsController(QObject):
             
             if success:
                 # Refresh script list
-                self.script_list_updated.emit(self._load_script_configurations())
+                self._schedule_script_list_update()
                 logger.info(f"Successfully added external script: {script_name}")
             else:
                 self.error_occurred.emit(
@@ -317,7 +375,7 @@ class SettingsController(QObject):
                     logger.warning(f"Failed clearing hotkey for removed external script {stem}: {e}")
             
             # Refresh script list
-            self.script_list_updated.emit(self._load_script_configurations())
+            self._schedule_script_list_update()
             
         except Exception as e:
             logger.error(f"Error removing external script {script_name}: {e}")
@@ -375,6 +433,8 @@ class SettingsController(QObject):
                 )
                 return
             
+            stem = script_info.file_path.stem
+            
             # Generate presets based on argument choices
             for arg in script_info.arguments:
                 if arg.choices:
@@ -382,13 +442,13 @@ class SettingsController(QObject):
                         preset_name = choice.replace('_', ' ').title()
                         arguments = {arg.name: choice}
                         self._settings_manager.save_script_preset(
-                            script_info.file_path.stem,
+                            stem,
                             preset_name,
                             arguments
                         )
             
             # Emit update
-            presets = self._settings_manager.get_script_presets(script_info.file_path.stem)
+            presets = self._settings_manager.get_script_presets(stem)
             self.preset_updated.emit(script_name, presets)
             
             logger.info(f"Generated {len(presets)} presets for {script_name}")
@@ -457,9 +517,11 @@ class SettingsController(QObject):
     def _get_display_name_for_stem(self, stem: str) -> Optional[str]:
         """Find the display name for a script given its file stem."""
         try:
-            for s in self._script_collection.get_all_scripts():
-                if s.file_path.stem == stem:
-                    return s.display_name
+            if self._display_name_by_stem is None:
+                self._display_name_by_stem = {
+                    s_stem: s.display_name for s, s_stem in reversed(self._get_scripts_with_stems())
+                }
+            return self._display_name_by_stem.get(stem)
         except Exception:
             pass
         return None
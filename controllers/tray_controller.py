@@ -5,8 +5,8 @@ This controller handles tray icon behavior, menu updates, and coordinates
 between tray-related models and the tray view.
 """
 import logging
-from typing import Dict, Any
-from PyQt6.QtCore import QObject, pyqtSignal
+from typing import Dict, Any, List
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
 
 from models.system_models import TrayIconModel, NotificationModel
 from controllers.script_controller import ScriptController
@@ -40,6 +40,9 @@ class TrayController(QObject):
         self._notification_model = notification_model
         self._script_controller = script_controller
         
+        # Coalesces menu rebuilds requested within one event-loop turn
+        self._menu_update_pending = False
+        
         # Connect model signals
         self._setup_model_connections()
         
@@ -75,6 +78,21 @@ class TrayController(QObject):
         except Exception as e:
             logger.error(f"Error updating menu: {e}")
     
+    @pyqtSlot()
+    def request_menu_update(self):
+        """Rebuild the tray menu once for a burst of changes."""
+        if self._menu_update_pending:
+            return
+        self._menu_update_pending = True
+        QTimer.singleShot(0, self._flush_menu_update)
+    
+    def _flush_menu_update(self):
+        """Run a pending tray menu rebuild, if any."""
+        if not self._menu_update_pending:
+            return
+        self._menu_update_pending = False
+        self.update_menu()
+    
     def _build_menu_structure(self, scripts) -> Dict[str, Any]:
         """Build the menu structure data for the view"""
         menu_items = []
@@ -113,9 +131,12 @@ class TrayController(QObject):
             
             # Second pass: build menu items with aligned formatting
             for script_info, effective_name, status, hotkey in script_data:
-                menu_items.append(self._build_script_menu_item(
+                item = self._build_script_menu_item(
                     script_info, effective_name, status, hotkey, max_name_length
-                ))
+                )
+                # Stable identity that lets the view reuse this item's menu objects
+                item['key'] = script_info.display_name
+                menu_items.append(item)
         return {
             'title': 'Desktop Utilities',
             'items': menu_items
@@ -162,8 +183,9 @@ class TrayController(QObject):
         
         if script_info.arguments:
             # Only show saved presets; no auto-discovery in tray.
-            if self._has_preset_configuration(script_name):
-                return self._build_preset_submenu_item(script_info, display_text)
+            preset_names = self._get_preset_names(script_name)
+            if preset_names:
+                return self._build_preset_submenu_item(script_info, display_text, preset_names)
             else:
                 return {
                     'type': 'action',
@@ -212,27 +234,9 @@ class TrayController(QObject):
             'items': submenu_items
         }
     
-    def _build_preset_submenu_item(self, script_info, display_text: str) -> Dict[str, Any]:
+    def _build_preset_submenu_item(self, script_info, display_text: str,
+                                   preset_names: List[str]) -> Dict[str, Any]:
         """Build submenu for script with saved presets from settings"""
-        preset_names = []
-        try:
-            preset_names = self._script_controller.get_preset_names(script_info.display_name)
-        except Exception:
-            preset_names = []
-
-        if not preset_names:
-            # Fallback to configure action if somehow no presets are returned
-            return {
-                'type': 'action',
-                'text': f"{display_text} (needs config)",
-                'enabled': True,
-                'data': {
-                    'action': 'configure_script',
-                    'script_name': script_info.display_name,
-                    'script_info': script_info
-                }
-            }
-
         submenu_items = []
         for preset in preset_names:
             submenu_items.append({
@@ -269,14 +273,15 @@ class TrayController(QObject):
             'items': submenu_items
         }
     
-    def _has_preset_configuration(self, script_name: str) -> bool:
-        """Check if script has preset configurations"""
+    def _get_preset_names(self, script_name: str) -> List[str]:
+        """Saved preset names for a script, read once per menu build"""
         try:
-            return self._script_controller.has_presets(script_name)
+            return self._script_controller.get_preset_names(script_name)
         except Exception:
-            return False
+            return []
     
     # User interaction handlers (called by views)
+    @pyqtSlot(dict)
     def handle_menu_action(self, action_data: Dict[str, Any]):
         """Handle a menu action triggered by the user"""
         if not action_data:
@@ -302,11 +307,13 @@ class TrayController(QObject):
         else:
             logger.warning(f"Unknown menu action: {action}")
     
+    @pyqtSlot()
     def handle_title_clicked(self):
         """Handle click on menu title (open settings)"""
         logger.info("Tray menu title clicked - opening settings")
         self.settings_dialog_requested.emit()
     
+    @pyqtSlot()
     def handle_exit_requested(self):
         """Handle application exit request from tray"""
         logger.info("Application exit requested from tray")
@@ -325,17 +332,17 @@ class TrayController(QObject):
     def _setup_model_connections(self):
         """Set up connections to model signals"""
         logger.debug("Setting up tray controller model connections...")
-        self._tray_model.menu_update_requested.connect(self.update_menu)
+        self._tray_model.menu_update_requested.connect(self.request_menu_update)
         self._tray_model.notification_requested.connect(self.notification_display_requested.emit)
         self._notification_model.notification_shown.connect(self.notification_display_requested.emit)
-        self._script_controller.script_list_updated.connect(lambda scripts: self.update_menu())
+        self._script_controller.script_list_updated.connect(lambda scripts: self.request_menu_update())
         
         # Connect script execution signals to update menu for running state
         self._script_controller._script_execution.script_execution_started.connect(
-            lambda name: self.update_menu())
+            lambda name: self.request_menu_update())
         self._script_controller._script_execution.script_execution_completed.connect(
-            lambda name, result: self.update_menu())
+            lambda name, result: self.request_menu_update())
         self._script_controller._script_execution.script_execution_failed.connect(
-            lambda name, error: self.update_menu())
+            lambda name, error: self.request_menu_update())
         
         logger.debug("Tray controller model connections setup complete")
@@ -1,7 +1,9 @@
+import ctypes
 import logging
+from ctypes import wintypes
 from typing import Dict, Optional, Tuple, Set
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
-from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QWidget
 import win32con
 import win32api
 import win32gui
@@ -15,6 +17,9 @@ MOD_SHIFT = 0x0004
 MOD_WIN = 0x0008
 MOD_NOREPEAT = 0x4000  # Prevents repeat when held down
 
+# Pointer type used to read every native message; built once rather than per event
+LPMSG = ctypes.POINTER(wintypes.MSG)
+
 # Virtual key code mappings
 VK_CODES = {
     'F1': win32con.VK_F1, 'F2': win32con.VK_F2, 'F3': win32con.VK_F3,
@@ -118,11 +123,8 @@ class HotkeyWidget(QWidget):
         """Handle native Windows events"""
         try:
             if eventType == "windows_generic_MSG":
-                import ctypes
-                from ctypes import wintypes
-                
                 # Cast the message to a MSG structure
-                msg = ctypes.cast(int(message), ctypes.POINTER(wintypes.MSG)).contents
+                msg = ctypes.cast(int(message), LPMSG).contents
                 
                 if msg.message == win32con.WM_HOTKEY:
                     hotkey_id = msg.wParam
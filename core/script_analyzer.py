@@ -123,7 +123,8 @@ class ScriptAnalyzer:
             if main_args:
                 arguments.extend(main_args)
         
-        logger.debug(f"Extracted {len(arguments)} arguments: {[arg.name for arg in arguments]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Extracted {len(arguments)} arguments: {[arg.name for arg in arguments]}")
         return arguments
     
     def _extract_argparse_arguments(self, tree: ast.AST) -> List[ArgumentInfo]:
@@ -85,7 +85,8 @@ class ScriptExecutor:
                     error=f"Required argument '{arg_info.name}' not provided"
                 )
         
-        logger.debug(f"Executing command: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Executing command: {' '.join(cmd)}")
         
         try:
             used_timeout = self.settings.get_script_timeout_seconds() if self.settings else 30
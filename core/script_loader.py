@@ -5,7 +5,7 @@ import traceback
 import logging
 import concurrent.futures
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from .script_analyzer import ScriptAnalyzer, ScriptInfo
 from .script_executor import ScriptExecutor
 from .exceptions import ScriptLoadError
@@ -15,11 +15,13 @@ logger = logging.getLogger('Core.ScriptLoader')
 
 class ScriptLoader:
     
-    def __init__(self, scripts_directory: str = "scripts"):
+    def __init__(self, scripts_directory: str = "scripts", settings: Optional[SettingsManager] = None):
         self.scripts_directory = Path(scripts_directory)
         self.loaded_scripts: Dict[str, ScriptInfo] = {}
         self.failed_scripts: Dict[str, str] = {}
-        self.settings = SettingsManager()
+        # Keys in loaded_scripts that came from external paths
+        self._external_script_names: Set[str] = set()
+        self.settings = settings or SettingsManager()
         self.analyzer = ScriptAnalyzer()
         self.executor = ScriptExecutor(self.settings)
         logger.info(f"ScriptLoader initialized with directory: {self.scripts_directory.absolute()}")
@@ -86,7 +88,7 @@ class ScriptLoader:
                     if script_info and script_info.is_executable:
                         scripts.append(script_info)
                         self.loaded_scripts[script_file.stem] = script_info
-                        logger.info(f"Successfully analyzed default script: {script_file.name}")
+                        logger.debug(f"Successfully analyzed default script: {script_file.name}")
                     elif script_info:
                         error_msg = f"Script not executable: {script_info.error}"
                         self.failed_scripts[script_file.name] = error_msg
@@ -121,11 +123,21 @@ class ScriptLoader:
         if not external_scripts:
             return scripts
         
+        # Checked against the directory rather than loaded_scripts, which the
+        # default discovery may still be filling in on another thread
+        default_script_names = self._get_default_script_names()
+        
         # Analyze external scripts in parallel
         with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
             # Submit all external script analysis tasks
             future_to_script = {}
             for script_name, script_path in external_scripts.items():
+                if script_name in default_script_names:
+                    error_msg = f"External script name collides with a default script: {script_name}"
+                    self.failed_scripts[f"{script_name} (external)"] = error_msg
+                    logger.warning(error_msg)
+                    continue
+                
                 # Validate the path still exists and is valid
                 if not self.settings.validate_external_script_path(script_path):
                     error_msg = f"External script path is invalid or missing: {script_path}"
@@ -146,7 +158,8 @@ class ScriptLoader:
                         script_info.display_name = script_name
                         scripts.append(script_info)
                         self.loaded_scripts[script_name] = script_info
-                        logger.info(f"Successfully analyzed external script: {script_name} -> {script_path}")
+                        self._external_script_names.add(script_name)
+                        logger.debug(f"Successfully analyzed external script: {script_name} -> {script_path}")
                     elif script_info:
                         error_msg = f"External script not executable: {script_info.error}"
                         self.failed_scripts[f"{script_name} (external)"] = error_msg
@@ -207,6 +220,7 @@ class ScriptLoader:
     def reload_scripts(self) -> List[ScriptInfo]:
         logger.info("Reloading all scripts")
         self.loaded_scripts.clear()
+        self._external_script_names.clear()
         
         # Clear executor's module cache thoroughly (removes from sys.modules too)
         try:
@@ -221,6 +235,16 @@ class ScriptLoader:
         
         return self.discover_scripts()
     
+    def _get_default_script_names(self) -> Set[str]:
+        """Stems of the scripts in the default scripts directory."""
+        if not self.scripts_directory.exists():
+            return set()
+        return {
+            script_file.stem
+            for script_file in self.scripts_directory.glob("*.py")
+            if not script_file.name.startswith("__")
+        }
+    
     def get_script(self, name: str) -> Optional[ScriptInfo]:
         return self.loaded_scripts.get(name)
     
@@ -258,8 +282,7 @@ class ScriptLoader:
     
     def is_external_script(self, script_name: str) -> bool:
         """Check if a script is an external script (loaded from external path)."""
-        external_scripts = self.settings.get_external_scripts()
-        return script_name in external_scripts
+        return self.settings.is_external_script(script_name)
     
     def get_external_script_path(self, script_name: str) -> Optional[str]:
         """Get the external path for an external script."""
@@ -269,24 +292,11 @@ class ScriptLoader:
         """Refresh only external scripts without affecting default scripts."""
         logger.info("Refreshing external scripts")
         
-        # First, identify all currently loaded external scripts
-        # These are scripts that are NOT in the default scripts directory
-        default_script_names = set()
-        if self.scripts_directory.exists():
-            for script_file in self.scripts_directory.glob("*.py"):
-                if not script_file.name.startswith("__"):
-                    default_script_names.add(script_file.stem)
-        
         # Remove ALL external scripts from loaded_scripts (not just the ones still in settings)
-        scripts_to_remove = []
-        for script_name, script_info in self.loaded_scripts.items():
-            # If it's not a default script, it must be external
-            if script_name not in default_script_names:
-                scripts_to_remove.append(script_name)
-        
-        for script_name in scripts_to_remove:
+        for script_name in self._external_script_names:
             logger.debug(f"Removing external script from loaded: {script_name}")
-            del self.loaded_scripts[script_name]
+            self.loaded_scripts.pop(script_name, None)
+        self._external_script_names.clear()
         
         # Remove external script failures from failed_scripts
         failed_keys_to_remove = [key for key in self.failed_scripts.keys() if "(external)" in key]
@@ -1,13 +1,26 @@
 import logging
 import re
-from typing import Any, Optional, Dict, List
-from PyQt6.QtCore import QSettings, QObject, pyqtSignal
+from typing import Any, Optional, Dict, List, Iterable, Set
+from PyQt6.QtCore import QSettings, QObject, QCoreApplication, QThread, QTimer, pyqtSignal
 
 logger = logging.getLogger('Core.Settings')
 
+# Custom display names: alphanumeric, spaces, and common punctuation
+_CUSTOM_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-_()[\]\.,:;!?\'"]+$')
+
 class SettingsManager(QObject):
     settings_changed = pyqtSignal(str, object)
     
+    # Storage files whose defaults were already written by this process
+    _defaults_ensured: Set[str] = set()
+    
+    # Writes within this window are flushed to disk together
+    SYNC_DELAY_MS = 100
+    
+    # One flush timer for all managers, so quitting flushes once
+    _sync_timer: Optional[QTimer] = None
+    _pending_sync: Set['SettingsManager'] = set()
+    
     DEFAULTS = {
         'startup': {
             'run_on_startup': False,
@@ -54,25 +67,31 @@ class SettingsManager(QObject):
         }
     }
     
+    # DEFAULTS flattened to full 'category/key' names for single-lookup reads
+    _KEY_DEFAULTS = {
+        f"{category}/{key}": default_value
+        for category, options in DEFAULTS.items()
+        for key, default_value in options.items()
+    }
+    
     def __init__(self):
         super().__init__()
         self.settings = QSettings('DesktopUtils', 'DesktopUtilityGUI')
         logger.info(f"Settings initialized. Storage: {self.settings.fileName()}")
-        self._ensure_defaults()
+        storage = self.settings.fileName()
+        if storage not in SettingsManager._defaults_ensured:
+            self._ensure_defaults()
+            SettingsManager._defaults_ensured.add(storage)
     
     def _ensure_defaults(self):
-        for category, options in self.DEFAULTS.items():
-            for key, default_value in options.items():
-                full_key = f"{category}/{key}"
-                if not self.settings.contains(full_key):
-                    self.settings.setValue(full_key, default_value)
-                    logger.debug(f"Set default: {full_key} = {default_value}")
+        for full_key, default_value in self._KEY_DEFAULTS.items():
+            if not self.settings.contains(full_key):
+                self.settings.setValue(full_key, default_value)
+                logger.debug("Set default: %s = %s", full_key, default_value)
     
     def get(self, key: str, default: Any = None) -> Any:
-        parts = key.split('/')
-        if len(parts) == 2 and parts[0] in self.DEFAULTS:
-            if parts[1] in self.DEFAULTS[parts[0]]:
-                default = self.DEFAULTS[parts[0]][parts[1]]
+        if key in self._KEY_DEFAULTS:
+            default = self._KEY_DEFAULTS[key]
         
         value = self.settings.value(key, default)
         
@@ -87,11 +106,36 @@ class SettingsManager(QObject):
     
     def set(self, key: str, value: Any) -> None:
         old_value = self.get(key)
+        if old_value == value and self.settings.contains(key):
+            # Unchanged: skip the write and the synchronous disk flush
+            return
         self.settings.setValue(key, value)
-        self.settings.sync()
+        self._schedule_sync()
         
         if old_value != value:
-            logger.debug(f"Setting changed: {key} = {value}")
+            logger.debug("Setting changed: %s = %s", key, value)
+            self.settings_changed.emit(key, value)
+    
+    def set_many(self, values: Dict[str, Any]) -> None:
+        """Write several settings with a single disk flush."""
+        written = False
+        changed = []
+        for key, value in values.items():
+            old_value = self.get(key)
+            if old_value == value and self.settings.contains(key):
+                # Unchanged: skip the write
+                continue
+            self.settings.setValue(key, value)
+            written = True
+            if old_value != value:
+                changed.append((key, value))
+        
+        if not written:
+            return
+        self._schedule_sync()
+        
+        for key, value in changed:
+            logger.debug("Setting changed: %s = %s", key, value)
             self.settings_changed.emit(key, value)
     
     def get_category(self, category: str) -> dict:
@@ -105,9 +149,7 @@ class SettingsManager(QObject):
         return result
     
     def set_category(self, category: str, values: dict) -> None:
-        for key, value in values.items():
-            full_key = f"{category}/{key}"
-            self.set(full_key, value)
+        self.set_many({f"{category}/{key}": value for key, value in values.items()})
     
     def reset_to_defaults(self) -> None:
         logger.info("Resetting all settings to defaults")
@@ -121,8 +163,35 @@ class SettingsManager(QObject):
         self.reset_to_defaults()
     
     def sync(self) -> None:
+        SettingsManager._pending_sync.discard(self)
         self.settings.sync()
     
+    @staticmethod
+    def _flush_pending_syncs() -> None:
+        """Flush every manager with writes waiting on the shared timer."""
+        pending = SettingsManager._pending_sync
+        SettingsManager._pending_sync = set()
+        for manager in pending:
+            manager.settings.sync()
+    
+    def _schedule_sync(self) -> None:
+        """Flush writes to disk once for a burst of changes instead of per write."""
+        app = QCoreApplication.instance()
+        if app is None or QThread.currentThread() is not app.thread() or self.thread() is not app.thread():
+            # No GUI event loop to defer to
+            self.settings.sync()
+            return
+        if SettingsManager._sync_timer is None:
+            timer = QTimer(app)
+            timer.setSingleShot(True)
+            timer.setInterval(self.SYNC_DELAY_MS)
+            timer.timeout.connect(SettingsManager._flush_pending_syncs)
+            # Don't lose a pending flush on exit
+            app.aboutToQuit.connect(SettingsManager._flush_pending_syncs)
+            SettingsManager._sync_timer = timer
+        SettingsManager._pending_sync.add(self)
+        SettingsManager._sync_timer.start()
+    
     # Convenience methods for common settings
     def is_run_on_startup(self) -> bool:
         return self.get('startup/run_on_startup', False)
@@ -180,7 +249,7 @@ class SettingsManager(QObject):
         key = f'script_notifications/{script_name}'
         if self.settings.contains(key):
             self.settings.remove(key)
-            self.settings.sync()
+            self._schedule_sync()
             logger.debug(f"Removed per-script notification setting for: {script_name}")
     
     def get_all_script_notifications(self) -> Dict[str, bool]:
@@ -210,7 +279,7 @@ class SettingsManager(QObject):
         """Get custom display name for a script, or None if no custom name is set."""
         return self.get(f'custom_names/{original_name}')
     
-    def set_custom_name(self, original_name: str, custom_name: str, existing_script_names: list = None) -> bool:
+    def set_custom_name(self, original_name: str, custom_name: str, existing_script_names: Optional[Iterable[str]] = None) -> bool:
         """Set a custom display name for a script. Returns True if successful, False if validation failed."""
         custom_name = custom_name.strip()
         
@@ -226,27 +295,30 @@ class SettingsManager(QObject):
         self.set(f'custom_names/{original_name}', custom_name)
         return True
     
-    def _validate_custom_name(self, name: str, original_name: str = None, existing_script_names: list = None) -> bool:
+    def _validate_custom_name(self, name: str, original_name: str = None, existing_script_names: Optional[Iterable[str]] = None) -> bool:
         """Validate custom name meets requirements."""
         # Length validation (1-50 characters)
         if len(name) < 1 or len(name) > 50:
             return False
         
         # Character validation - allow alphanumeric, spaces, and common punctuation
-        if not re.match(r'^[a-zA-Z0-9\s\-_()[\]\.,:;!?\'"]+$', name):
+        if not _CUSTOM_NAME_PATTERN.match(name):
             return False
         
+        # Names are compared case-insensitively; fold the candidate once
+        folded_name = name.lower()
+        
         # Conflict validation - check if custom name matches any existing script names
         if existing_script_names:
             for script_name in existing_script_names:
-                if script_name != original_name and name.lower() == script_name.lower():
+                if script_name != original_name and script_name.lower() == folded_name:
                     logger.warning(f"Custom name '{name}' conflicts with existing script '{script_name}'")
                     return False
         
         # Check if custom name conflicts with other custom names
         existing_custom_names = self.get_all_custom_names()
         for orig_name, custom_name in existing_custom_names.items():
-            if orig_name != original_name and custom_name.lower() == name.lower():
+            if orig_name != original_name and custom_name.lower() == folded_name:
                 logger.warning(f"Custom name '{name}' conflicts with existing custom name for '{orig_name}'")
                 return False
             
@@ -257,7 +329,7 @@ class SettingsManager(QObject):
         key = f'custom_names/{original_name}'
         if self.settings.contains(key):
             self.settings.remove(key)
-            self.settings.sync()
+            self._schedule_sync()
             logger.debug(f"Removed custom name for: {original_name}")
     
     def get_all_custom_names(self) -> Dict[str, str]:
@@ -314,8 +386,10 @@ class SettingsManager(QObject):
             self.settings.endGroup()
         
         # Set new arguments
-        for arg_name, value in arguments.items():
-            self.set_script_argument(script_name, arg_name, value)
+        self.set_many({
+            f'script_arguments/{script_name}/{arg_name}': value
+            for arg_name, value in arguments.items()
+        })
     
     def set_script_argument(self, script_name: str, arg_name: str, value: Any) -> None:
         """Set a specific argument value for a script."""
@@ -332,7 +406,7 @@ class SettingsManager(QObject):
         key = f'script_arguments/{script_name}/{arg_name}'
         if self.settings.contains(key):
             self.settings.remove(key)
-            self.settings.sync()
+            self._schedule_sync()
             logger.debug(f"Removed argument {arg_name} for script: {script_name}")
     
     def remove_all_script_arguments(self, script_name: str) -> None:
@@ -340,7 +414,7 @@ class SettingsManager(QObject):
         self.settings.beginGroup(f'script_arguments/{script_name}')
         try:
             self.settings.remove('')  # Remove all keys in this group
-            self.settings.sync()
+            self._schedule_sync()
             logger.debug(f"Removed all arguments for script: {script_name}")
         finally:
             self.settings.endGroup()
@@ -405,9 +479,10 @@ class SettingsManager(QObject):
         self.delete_script_preset(script_name, preset_name)
         
         # Save new preset
-        for arg_name, value in arguments.items():
-            key = f'script_presets/{script_name}/{preset_name}/{arg_name}'
-            self.set(key, value)
+        self.set_many({
+            f'script_presets/{script_name}/{preset_name}/{arg_name}': value
+            for arg_name, value in arguments.items()
+        })
         
         logger.info(f"Saved preset '{preset_name}' for script '{script_name}' with {len(arguments)} arguments")
     
@@ -417,7 +492,7 @@ class SettingsManager(QObject):
         self.settings.beginGroup(preset_key)
         try:
             self.settings.remove('')  # Remove all keys in this group
-            self.settings.sync()
+            self._schedule_sync()
             logger.debug(f"Deleted preset '{preset_name}' for script '{script_name}'")
         finally:
             self.settings.endGroup()
@@ -436,6 +511,14 @@ class SettingsManager(QObject):
         """Check if a script has any configured presets."""
         return len(self.get_script_preset_names(script_name)) > 0
     
+    def get_preset_script_names(self) -> List[str]:
+        """Get the names of all scripts that have presets stored."""
+        self.settings.beginGroup('script_presets')
+        try:
+            return self.settings.childGroups()
+        finally:
+            self.settings.endGroup()
+    
     def get_all_scripts_with_presets(self) -> Dict[str, List[str]]:
         """Get all scripts that have presets as {script_name: [preset_names]}."""
         result = {}
@@ -457,7 +540,7 @@ class SettingsManager(QObject):
         self.settings.beginGroup('script_presets')
         try:
             self.settings.remove('')
-            self.settings.sync()
+            self._schedule_sync()
             logger.info("Cleared all script presets")
         finally:
             self.settings.endGroup()
@@ -509,7 +592,7 @@ class SettingsManager(QObject):
         key = f'external_scripts/{script_name}'
         if self.settings.contains(key):
             self.settings.remove(key)
-            self.settings.sync()
+            self._schedule_sync()
             logger.info(f"Removed external script: {script_name}")
     
     def update_external_script_path(self, script_name: str, new_absolute_path: str) -> bool:
@@ -581,9 +664,17 @@ class SettingsManager(QObject):
         """Get the absolute path for a specific external script."""
         return self.get(f'external_scripts/{script_name}')
     
+    def is_external_script(self, script_name: str) -> bool:
+        """Check if a script is configured as an external script."""
+        return self.settings.contains(f'external_scripts/{script_name}')
+    
     def has_external_scripts(self) -> bool:
         """Check if any external scripts are configured."""
-        return len(self.get_external_scripts()) > 0
+        self.settings.beginGroup('external_scripts')
+        try:
+            return bool(self.settings.childKeys())
+        finally:
+            self.settings.endGroup()
     
     # Disabled scripts management methods
     def get_disabled_scripts(self) -> set:
@@ -617,7 +708,8 @@ class SettingsManager(QObject):
     
     def is_script_disabled(self, script_name: str) -> bool:
         """Check if a native script is disabled."""
-        return script_name in self.get_disabled_scripts()
+        # Single key lookup rather than reading the whole group
+        return self.settings.value(f'disabled_scripts/{script_name}', False, bool)
 
     # Backwards-compatible helpers used by models/tests
     def add_disabled_script(self, script_name: str) -> None:
@@ -633,7 +725,7 @@ class SettingsManager(QObject):
         self.settings.beginGroup('custom_names')
         try:
             self.settings.remove('')
-            self.settings.sync()
+            self._schedule_sync()
             logger.info("Cleared all custom script names")
         finally:
             self.settings.endGroup()
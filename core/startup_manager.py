@@ -24,6 +24,10 @@ class StartupManager:
             main_script = Path(__file__).parent.parent / "main.py"
             return f'"{sys.executable}" "{main_script.absolute()}"'
     
+    def _startup_command(self) -> str:
+        # Add --minimized flag to start in tray
+        return f'{self.executable_path} --minimized'
+    
     def is_registered(self) -> bool:
         if sys.platform != 'win32':
             return False
@@ -47,8 +51,7 @@ class StartupManager:
         
         try:
             with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.startup_key_path, 0, winreg.KEY_WRITE) as key:
-                # Add --minimized flag to start in tray
-                startup_command = f'{self.executable_path} --minimized'
+                startup_command = self._startup_command()
                 winreg.SetValueEx(key, self.APP_NAME, 0, winreg.REG_SZ, startup_command)
                 logger.info(f"Successfully registered for startup: {startup_command}")
                 return True
@@ -74,6 +77,14 @@ class StartupManager:
             return False
     
     def set_startup(self, enabled: bool) -> bool:
+        if sys.platform == 'win32':
+            # Skip the registry write when the entry already matches
+            current_command = self.get_registered_command()
+            if enabled and current_command == self._startup_command():
+                return True
+            if not enabled and current_command is None:
+                return True
+        
         if enabled:
             return self.register()
         else:
@@ -95,11 +106,12 @@ class StartupManager:
             return None
     
     def update_path_if_needed(self) -> bool:
-        if not self.is_registered():
+        # One registry read answers both "registered?" and "current path?"
+        current_command = self.get_registered_command()
+        if current_command is None:
             return True
         
-        current_command = self.get_registered_command()
-        expected_command = f'{self.executable_path} --minimized'
+        expected_command = self._startup_command()
         
         if current_command != expected_command:
             logger.info(f"Updating startup path from '{current_command}' to '{expected_command}'")
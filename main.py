@@ -21,8 +21,6 @@ from controllers.settings_controller import SettingsController
 from views.tray_view import TrayView
 from views.main_view import MainView
 from views.settings_view import SettingsView
-from views.hotkey_config_view import HotkeyConfigView
-from views.preset_editor_view import PresetEditorView
 from core.hotkey_manager import HotkeyManager
 from core.memory_monitor import get_memory_monitor
 
@@ -137,6 +135,8 @@ class MVCApplication:
         self._settings_view = None
         self._settings_controller = None
         self._settings_opening = False
+        # Preset editor dialogs by script stem, reused across opens
+        self._preset_editors = {}
         
     def initialize(self):
         """Initialize all MVC components and set up connections"""
@@ -370,8 +370,8 @@ class MVCApplication:
         # Show tray icon
         self.tray_view.show_icon()
         
-        # Update tray menu with current scripts
-        self.tray_controller.update_menu()
+        # Build the tray menu once the event loop runs, after script discovery
+        self.tray_controller.request_menu_update()
     
     def _handle_exit_request(self):
         """Handle application exit request"""
@@ -455,13 +455,10 @@ class MVCApplication:
         # Instant-apply: no accept/save button; models persist on change
         
         # Controller -> View connections
-        self._settings_controller.settings_loaded.connect(lambda data: (
-            self._settings_view.update_startup_settings(data.get('startup', {})),
-            self._settings_view.update_behavior_settings(data.get('behavior', {})),
-            self._settings_view.update_execution_settings(data.get('execution', {})),
-            self._settings_view.update_script_list(data.get('scripts', [])),
-            self._settings_view.set_all_presets(data.get('presets', {}))
-        ))
+        # load_all_settings also emits each category below, so only presets come from here
+        self._settings_controller.settings_loaded.connect(
+            lambda data: self._settings_view.set_all_presets(data.get('presets', {}))
+        )
         self._settings_controller.startup_settings_updated.connect(self._settings_view.update_startup_settings)
         self._settings_controller.behavior_settings_updated.connect(self._settings_view.update_behavior_settings)
         self._settings_controller.execution_settings_updated.connect(self._settings_view.update_execution_settings)
@@ -471,7 +468,7 @@ class MVCApplication:
         self._settings_controller.preset_updated.connect(self._settings_view.update_preset_list)
         # When presets change, refresh tray menu so preset submenus reflect changes
         try:
-            self._settings_controller.preset_updated.connect(lambda *_: self.tray_controller.update_menu())
+            self._settings_controller.preset_updated.connect(lambda *_: self.tray_controller.request_menu_update())
         except Exception:
             pass
         # Removed unnecessary confirmation popups for settings_saved and settings_reset
@@ -480,7 +477,7 @@ class MVCApplication:
 
         # Also refresh the tray menu when script list metadata changes (e.g., custom names)
         try:
-            self._settings_controller.script_list_updated.connect(lambda *_: self.tray_controller.update_menu())
+            self._settings_controller.script_list_updated.connect(lambda *_: self.tray_controller.request_menu_update())
         except Exception:
             pass
         
@@ -505,6 +502,9 @@ class MVCApplication:
     
     def _handle_hotkey_config(self, script_name, settings_controller):
         """Handle hotkey configuration dialog"""
+        # Imported on first use; the dialog is only needed after a user action
+        from views.hotkey_config_view import HotkeyConfigView
+        
         # Get current hotkey for script
         current_hotkey = self.script_controller._hotkey_model.get_hotkey_for_script(script_name)
         
@@ -521,10 +521,14 @@ class MVCApplication:
     
     def _handle_preset_editor(self, script_name, settings_controller, preset_name: str = None):
         """Handle preset editor dialog for add or edit."""
+        # Imported on first use; the dialog is only needed after a user action
+        from views.preset_editor_view import PresetEditorView
+        
         # Get script info
         script_info = self.script_controller._script_collection.get_script_by_name(script_name)
         if not script_info:
             return
+        stem = script_info.file_path.stem
         
         # Get script arguments
         script_args = []
@@ -538,18 +542,22 @@ class MVCApplication:
                 })
         
         # Determine initial values for edit vs add
-        existing_presets = settings_controller.get_script_presets(script_info.file_path.stem)
+        existing_presets = settings_controller.get_script_presets(stem)
         initial_name = preset_name if preset_name else None
         initial_args = existing_presets.get(preset_name, {}) if preset_name else None
 
-        # Create preset editor view (single-preset editor)
-        preset_view = PresetEditorView(
-            script_name, script_args, self.main_view,
-            initial_name=initial_name, initial_args=initial_args
-        )
+        # Reuse the script's preset editor unless its arguments changed
+        preset_view = self._preset_editors.get(stem)
+        if (preset_view is None or preset_view.script_name != script_name
+                or preset_view.script_args != script_args):
+            if preset_view is not None:
+                preset_view.deleteLater()
+            preset_view = PresetEditorView(script_name, script_args, self.main_view)
+            self._preset_editors[stem] = preset_view
+        preset_view.load_preset(initial_name, initial_args)
         
         # Connect signals
-        def _save_or_rename_preset(new_name, args, _old_name=preset_name, _stem=script_info.file_path.stem):
+        def _save_or_rename_preset(new_name, args, _old_name=preset_name, _stem=stem):
             try:
                 if _old_name and new_name != _old_name:
                     # Rename: delete old then save new
@@ -563,7 +571,11 @@ class MVCApplication:
         # Deletion handled from Script Args tab; editor focuses on a single preset
         
         # Show dialog
-        preset_view.exec()
+        try:
+            preset_view.exec()
+        finally:
+            # The next open connects its own handler
+            preset_view.preset_saved.disconnect(_save_or_rename_preset)
     
     def _validate_hotkey(self, hotkey, script_name, hotkey_view):
         """Validate a hotkey and show feedback in view"""
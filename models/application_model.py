@@ -196,11 +196,15 @@ class ApplicationStateModel(QObject):
     # Internal signal handlers
     def _on_setting_changed(self, key: str, value: Any):
         """Handle settings changes and emit appropriate signals"""
+        # Each payload re-reads its whole category, so only build it for listeners
         if key.startswith('startup/'):
-            self.startup_settings_changed.emit(self.get_startup_settings())
+            if self.receivers(self.startup_settings_changed):
+                self.startup_settings_changed.emit(self.get_startup_settings())
         elif key.startswith('behavior/'):
-            self.behavior_settings_changed.emit(self.get_behavior_settings())
+            if self.receivers(self.behavior_settings_changed):
+                self.behavior_settings_changed.emit(self.get_behavior_settings())
         elif key.startswith('execution/'):
-            self.execution_settings_changed.emit(self.get_execution_settings())
+            if self.receivers(self.execution_settings_changed):
+                self.execution_settings_changed.emit(self.get_execution_settings())
         
         logger.debug(f"Application setting changed: {key} = {value}")
@@ -76,10 +76,14 @@ class ScriptCollectionModel(QObject):
     
     def __init__(self, scripts_directory: str = "scripts"):
         super().__init__()
-        self._script_loader = ScriptLoader(scripts_directory)
         self._settings = SettingsManager()
+        # Share one settings manager with the loader
+        self._script_loader = ScriptLoader(scripts_directory, self._settings)
         
         self._all_scripts: List[ScriptInfo] = []
+        # Lookup indexes over _all_scripts, rebuilt whenever it is replaced
+        self._scripts_by_display_name: Dict[str, ScriptInfo] = {}
+        self._scripts_by_stem: Dict[str, ScriptInfo] = {}
         self._available_scripts: List[ScriptInfo] = []
         self._disabled_scripts: Set[str] = set()
         self._external_scripts: Dict[str, str] = {}
@@ -91,7 +95,7 @@ class ScriptCollectionModel(QObject):
         logger.info("Discovering scripts...")
         
         try:
-            self._all_scripts = self._script_loader.discover_scripts()
+            self._set_all_scripts(self._script_loader.discover_scripts())
             self.scripts_discovered.emit(self._all_scripts)
             
             # Apply filtering
@@ -110,6 +114,32 @@ class ScriptCollectionModel(QObject):
         logger.info("Refreshing scripts...")
         return self.discover_scripts()
     
+    def _refresh_external_scripts(self) -> List[ScriptInfo]:
+        """Re-analyze external scripts only; default scripts keep their cached analysis."""
+        try:
+            self._set_all_scripts(self._script_loader.refresh_external_scripts())
+            self.scripts_discovered.emit(self._all_scripts)
+            self._update_available_scripts()
+            return self._available_scripts
+        except Exception as e:
+            logger.error(f"Error refreshing external scripts: {e}")
+            return []
+    
+    def _set_all_scripts(self, scripts: List[ScriptInfo]):
+        """Replace the discovered scripts and rebuild the name lookups."""
+        self._all_scripts = scripts
+        by_display_name: Dict[str, ScriptInfo] = {}
+        by_stem: Dict[str, ScriptInfo] = {}
+        for script in scripts:
+            # First match wins, as with a front-to-back scan
+            by_display_name.setdefault(script.display_name, script)
+            try:
+                by_stem.setdefault(script.file_path.stem.lower(), script)
+            except Exception:
+                pass
+        self._scripts_by_display_name = by_display_name
+        self._scripts_by_stem = by_stem
+    
     def get_all_scripts(self) -> List[ScriptInfo]:
         """Get all discovered scripts (including disabled)"""
         return self._all_scripts.copy()
@@ -125,19 +155,12 @@ class ScriptCollectionModel(QObject):
         identifier used for hotkeys and settings (e.g., "display_toggle").
         """
         # First, try exact display name match
-        for script in self._all_scripts:
-            if script.display_name == name:
-                return script
+        script = self._scripts_by_display_name.get(name)
+        if script is not None:
+            return script
 
         # Fallback: try file stem match (hotkey/settings use stems)
-        lname = (name or "").strip().lower()
-        for script in self._all_scripts:
-            try:
-                if script.file_path.stem.lower() == lname:
-                    return script
-            except Exception:
-                pass
-        return None
+        return self._scripts_by_stem.get((name or "").strip().lower())
     
     def is_script_disabled(self, script_name: str) -> bool:
         """Check if a script is disabled"""
@@ -178,8 +201,8 @@ class ScriptCollectionModel(QObject):
             self._settings.add_external_script(script_name, script_path)
             self._external_scripts[script_name] = script_path
             
-            # Refresh scripts to include the new one
-            self.refresh_scripts()
+            # Refresh external scripts to include the new one
+            self._refresh_external_scripts()
             
             self.external_script_added.emit(script_name, script_path)
             logger.info(f"Added external script: {script_name} -> {script_path}")
@@ -198,8 +221,8 @@ class ScriptCollectionModel(QObject):
             self._settings.remove_external_script(script_name)
             del self._external_scripts[script_name]
             
-            # Refresh scripts to remove it from the collection
-            self.refresh_scripts()
+            # Refresh external scripts to remove it from the collection
+            self._refresh_external_scripts()
             
             self.external_script_removed.emit(script_name)
             logger.info(f"Removed external script: {script_name} -> {script_path}")
@@ -253,7 +276,7 @@ class ScriptExecutionModel(QObject):
         super().__init__()
         self._script_collection = script_collection
         self._script_loader = script_collection._script_loader
-        self._settings = SettingsManager()
+        self._settings = script_collection._settings
         
         self._execution_results: Dict[str, Dict[str, Any]] = {}
         self._active_workers: Dict[str, ScriptExecutionWorker] = {}  # Track active execution threads
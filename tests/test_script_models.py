@@ -8,6 +8,8 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
+import tempfile
+from pathlib import Path
 
 # Add project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -147,6 +149,72 @@ class TestScriptCollectionModel(unittest.TestCase):
         self.mock_settings.remove_disabled_script.assert_called_with("Test Script 1")
 
 
+class TestExternalScripts(unittest.TestCase):
+    """Test cases for adding and removing external scripts"""
+    
+    SCRIPT_SOURCE = "def main():\n    return 'ok'\n"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for tests"""
+        if not QCoreApplication.instance():
+            cls.app = QCoreApplication([])
+        else:
+            cls.app = QCoreApplication.instance()
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.scripts_dir = root / "scripts"
+        self.scripts_dir.mkdir()
+        (self.scripts_dir / "default_script.py").write_text(self.SCRIPT_SOURCE)
+        self.external_path = root / "external_script.py"
+        self.external_path.write_text(self.SCRIPT_SOURCE)
+        
+        # Settings backed by a plain dict of configured external scripts
+        self.configured = {}
+        mock_settings_instance = Mock()
+        mock_settings_instance.get_disabled_scripts.return_value = []
+        mock_settings_instance.get_external_scripts.side_effect = lambda: dict(self.configured)
+        mock_settings_instance.validate_external_script_path.return_value = True
+        mock_settings_instance.add_external_script.side_effect = self.configured.__setitem__
+        mock_settings_instance.remove_external_script.side_effect = self.configured.pop
+        
+        with patch('models.script_models.SettingsManager') as mock_settings:
+            mock_settings.return_value = mock_settings_instance
+            self.model = ScriptCollectionModel(str(self.scripts_dir))
+        self.model.discover_scripts()
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+    
+    def _loaded_paths(self):
+        return sorted(script.file_path.name for script in self.model.get_all_scripts())
+    
+    def test_add_then_remove_external_script(self):
+        """Test that a removed external script leaves the collection"""
+        self.assertTrue(self.model.add_external_script("My Script", str(self.external_path)))
+        self.assertEqual(self._loaded_paths(), ["default_script.py", "external_script.py"])
+        self.assertIsNotNone(self.model.get_script_by_name("My Script"))
+        
+        self.model.remove_external_script("My Script")
+        self.assertEqual(self._loaded_paths(), ["default_script.py"])
+        self.assertIsNone(self.model.get_script_by_name("My Script"))
+    
+    def test_external_name_colliding_with_default_script(self):
+        """Test that an external script named like a default script cannot replace it"""
+        self.model.add_external_script("default_script", str(self.external_path))
+        self.assertEqual(self._loaded_paths(), ["default_script.py"])
+        self.assertIn("default_script (external)", self.model._script_loader.get_failed_scripts())
+        
+        self.model.remove_external_script("default_script")
+        self.assertEqual(self._loaded_paths(), ["default_script.py"])
+        self.assertEqual(self.model._script_loader.get_script("default_script").file_path,
+                         self.scripts_dir / "default_script.py")
+
+
 class TestScriptExecutionModel(unittest.TestCase):
     """Test cases for ScriptExecutionModel"""
     
@@ -0,0 +1,151 @@
+"""
+Unit tests for SettingsManager.
+
+These tests run against a throwaway INI file so they never touch the
+user's real settings.
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QCoreApplication, QSettings
+from PyQt6.QtTest import QSignalSpy
+from core.settings import SettingsManager
+
+
+class TestSettingsManager(unittest.TestCase):
+    """Test cases for SettingsManager"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for tests"""
+        if not QCoreApplication.instance():
+            cls.app = QCoreApplication([])
+        else:
+            cls.app = QCoreApplication.instance()
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.settings_path = os.path.join(self.temp_dir.name, 'settings.ini')
+        self.manager = self._create_manager(self.settings_path)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.manager.sync()
+        self.temp_dir.cleanup()
+
+    def _create_manager(self, path):
+        """Create a SettingsManager backed by an INI file at path"""
+        with patch('core.settings.QSettings',
+                   side_effect=lambda *args: QSettings(path, QSettings.Format.IniFormat)):
+            return SettingsManager()
+
+    def _read_from_disk(self, key, **kwargs):
+        """Read a key through a fresh QSettings so only flushed values are seen"""
+        self.manager.sync()
+        return QSettings(self.settings_path, QSettings.Format.IniFormat).value(key, **kwargs)
+
+    def test_defaults_written_to_each_storage(self):
+        """Test that a second manager on fresh storage still gets defaults"""
+        other_path = os.path.join(self.temp_dir.name, 'other.ini')
+        other = self._create_manager(other_path)
+        other.sync()
+
+        for path in (self.settings_path, other_path):
+            stored = QSettings(path, QSettings.Format.IniFormat)
+            self.assertTrue(stored.contains('behavior/minimize_to_tray'))
+            self.assertTrue(stored.contains('execution/script_timeout_seconds'))
+
+    def test_managers_share_one_sync_timer(self):
+        """Test that pending writes from several managers flush together"""
+        other_path = os.path.join(self.temp_dir.name, 'other.ini')
+        other = self._create_manager(other_path)
+
+        self.manager.set('hotkeys/first', 'Ctrl+Alt+1')
+        timer = SettingsManager._sync_timer
+        other.set('hotkeys/second', 'Ctrl+Alt+2')
+
+        self.assertIs(SettingsManager._sync_timer, timer)
+        self.assertTrue(timer.isActive())
+        self.assertEqual(SettingsManager._pending_sync, {self.manager, other})
+
+        SettingsManager._flush_pending_syncs()
+
+        self.assertEqual(SettingsManager._pending_sync, set())
+        self.assertEqual(QSettings(self.settings_path, QSettings.Format.IniFormat).value('hotkeys/first'),
+                         'Ctrl+Alt+1')
+        self.assertEqual(QSettings(other_path, QSettings.Format.IniFormat).value('hotkeys/second'),
+                         'Ctrl+Alt+2')
+
+    def test_set_unchanged_value_skips_write(self):
+        """Test that setting an unchanged value neither writes nor emits"""
+        self.manager.set('hotkeys/test_script', 'Ctrl+Alt+T')
+        spy = QSignalSpy(self.manager.settings_changed)
+
+        with patch.object(self.manager.settings, 'setValue') as mock_set_value:
+            self.manager.set('hotkeys/test_script', 'Ctrl+Alt+T')
+
+        mock_set_value.assert_not_called()
+        self.assertEqual(len(spy), 0)
+
+    def test_set_new_key_is_written(self):
+        """Test that a key not yet in storage is written and announced"""
+        spy = QSignalSpy(self.manager.settings_changed)
+
+        self.manager.set('hotkeys/test_script', 'Ctrl+Alt+T')
+
+        self.assertEqual(self._read_from_disk('hotkeys/test_script'), 'Ctrl+Alt+T')
+        self.assertEqual(len(spy), 1)
+        self.assertEqual(spy[0], ['hotkeys/test_script', 'Ctrl+Alt+T'])
+
+    def test_set_many_emits_once_per_changed_key_after_writes(self):
+        """Test that set_many signals each changed key once, after all writes"""
+        self.manager.set('hotkeys/unchanged', 'Ctrl+Alt+U')
+        values = {
+            'hotkeys/unchanged': 'Ctrl+Alt+U',
+            'hotkeys/first': 'Ctrl+Alt+1',
+            'hotkeys/second': 'Ctrl+Alt+2',
+        }
+        emitted = []
+
+        def on_changed(key, value):
+            # Every write must already be visible when any signal fires
+            stored = {k: self.manager.settings.value(k) for k in values}
+            emitted.append((key, value, stored))
+
+        self.manager.settings_changed.connect(on_changed)
+        self.manager.set_many(values)
+
+        self.assertEqual([(key, value) for key, value, _ in emitted],
+                         [('hotkeys/first', 'Ctrl+Alt+1'), ('hotkeys/second', 'Ctrl+Alt+2')])
+        for _, _, stored in emitted:
+            self.assertEqual(stored, values)
+
+    def test_set_category_persists(self):
+        """Test that set_category writes every value to storage"""
+        self.manager.set_category('behavior', {'minimize_to_tray': False, 'close_to_tray': False})
+
+        self.assertIs(self._read_from_disk('behavior/minimize_to_tray', type=bool), False)
+        self.assertIs(self._read_from_disk('behavior/close_to_tray', type=bool), False)
+        self.assertEqual(self.manager.get_category('behavior')['minimize_to_tray'], False)
+
+    def test_reset_to_defaults_persists(self):
+        """Test that reset_to_defaults clears custom values and writes defaults"""
+        self.manager.set('behavior/minimize_to_tray', False)
+        self.manager.set('hotkeys/test_script', 'Ctrl+Alt+T')
+
+        self.manager.reset_to_defaults()
+
+        self.assertIsNone(self._read_from_disk('hotkeys/test_script'))
+        self.assertIs(self._read_from_disk('behavior/minimize_to_tray', type=bool), True)
+        self.assertTrue(self.manager.is_minimize_to_tray())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,277 @@
+"""
+Unit tests for the settings view table models.
+
+These tests exercise the Scripts and Presets tab models and their
+keyboard handling on the offscreen platform.
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtTest import QSignalSpy, QTest
+from views.settings_view import SettingsView, ScriptTableModel, PresetTableModel, DISABLED_ROW_ROLE
+
+# Views need a QApplication; create it at import time, before other test
+# modules can create a plain QCoreApplication in their setUpClass
+_app = QApplication.instance() or QApplication([])
+
+
+def _script(name, **overrides):
+    """Script dict shaped like the ones the settings controller sends"""
+    script = {
+        'name': name,
+        'display_name': name.replace('_', ' ').title(),
+        'file_path': f'/scripts/{name}.py',
+        'is_external': False,
+        'is_disabled': False,
+        'hotkey': None,
+        'custom_name': None,
+    }
+    script.update(overrides)
+    return script
+
+
+class TestScriptTableModel(unittest.TestCase):
+    """Test cases for ScriptTableModel"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for tests"""
+        cls.app = _app
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.model = ScriptTableModel()
+        self.model.set_scripts([_script('alpha'), _script('beta'), _script('gamma')])
+
+    def test_update_scripts_reports_only_changed_rows(self):
+        """Test that update_scripts signals rows whose data changed"""
+        reset_spy = QSignalSpy(self.model.modelReset)
+        changed_spy = QSignalSpy(self.model.dataChanged)
+
+        self.model.update_scripts([_script('alpha'), _script('beta', hotkey='Ctrl+Alt+B'),
+                                   _script('gamma')])
+
+        self.assertEqual(len(reset_spy), 0)
+        self.assertEqual(len(changed_spy), 1)
+        top_left, bottom_right = changed_spy[0][0], changed_spy[0][1]
+        self.assertEqual((top_left.row(), bottom_right.row()), (1, 1))
+        self.assertEqual(self.model.index(1, ScriptTableModel.COL_HOTKEY).data(), 'Ctrl+Alt+B')
+
+    def test_refresh_rows_range_and_column(self):
+        """Test refresh_rows defaults to every cell and can target one column"""
+        changed_spy = QSignalSpy(self.model.dataChanged)
+
+        self.model.refresh_rows()
+        self.model.refresh_rows(2, 2, ScriptTableModel.COL_HOTKEY)
+
+        last_col = len(ScriptTableModel.HEADERS) - 1
+        cells = [((args[0].row(), args[0].column()), (args[1].row(), args[1].column()))
+                 for args in changed_spy]
+        self.assertEqual(cells, [
+            ((0, 0), (2, last_col)),
+            ((2, ScriptTableModel.COL_HOTKEY), (2, ScriptTableModel.COL_HOTKEY)),
+        ])
+
+    def test_refresh_rows_without_scripts(self):
+        """Test refresh_rows on an empty model emits nothing"""
+        self.model.set_scripts([])
+        changed_spy = QSignalSpy(self.model.dataChanged)
+
+        self.model.refresh_rows()
+
+        self.assertEqual(len(changed_spy), 0)
+
+    def test_disabled_role_keeps_action_cell_live(self):
+        """Test that disabled rows flag every cell except ACTION"""
+        self.model.set_scripts([_script('alpha', is_disabled=True), _script('beta')])
+
+        flags = [self.model.index(0, col).data(DISABLED_ROW_ROLE)
+                 for col in range(len(ScriptTableModel.HEADERS))]
+        self.assertEqual(flags, [False, True, True, True])
+        self.assertEqual(self.model.index(0, ScriptTableModel.COL_ACTION).data(), 'Enable')
+        self.assertFalse(self.model.index(1, ScriptTableModel.COL_HOTKEY).data(DISABLED_ROW_ROLE))
+
+
+class TestScriptTableKeyboard(unittest.TestCase):
+    """Test cases for operating the scripts table from the keyboard"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for tests"""
+        cls.app = _app
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.view = SettingsView()
+        self.view.tab_widget.setCurrentIndex(1)  # Builds the Scripts tab
+        self.view.update_script_list([_script('alpha'), _script('beta', is_disabled=True)])
+        self.view.script_model.set_scripts(self.view._script_data)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.view.deleteLater()
+
+    def _press(self, row, column, key):
+        table = self.view.script_table
+        table.setCurrentIndex(self.view.script_model.index(row, column))
+        QTest.keyClick(table, key)
+
+    def test_enter_on_hotkey_cell_requests_configuration(self):
+        """Test that Enter on a HOTKEY cell acts like a click"""
+        spy = QSignalSpy(self.view.hotkey_configuration_requested)
+
+        self._press(0, ScriptTableModel.COL_HOTKEY, Qt.Key.Key_Return)
+
+        self.assertEqual(len(spy), 1)
+        self.assertEqual(spy[0][0], 'alpha')
+
+    def test_space_on_action_cell_toggles_script(self):
+        """Test that Space on an ACTION cell toggles the script"""
+        spy = QSignalSpy(self.view.script_toggled)
+
+        self._press(1, ScriptTableModel.COL_ACTION, Qt.Key.Key_Space)
+
+        self.assertEqual(len(spy), 1)
+        self.assertEqual(spy[0], ['Beta', True])
+
+    def test_keys_ignored_on_disabled_cells(self):
+        """Test that disabled rows only react on their ACTION cell"""
+        spy = QSignalSpy(self.view.hotkey_configuration_requested)
+
+        self._press(1, ScriptTableModel.COL_HOTKEY, Qt.Key.Key_Return)
+
+        self.assertEqual(len(spy), 0)
+
+
+class TestPresetTableModel(unittest.TestCase):
+    """Test cases for PresetTableModel"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for tests"""
+        cls.app = _app
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.presets = {
+            'Bravo': {'device': 'speakers'},
+            'alpha': {'device': 'headphones'},
+            'Delta': {},
+        }
+        self.model = PresetTableModel()
+        self.model.set_presets(self.presets)
+        self.reset_spy = QSignalSpy(self.model.modelReset)
+
+    def _names(self):
+        return [self.model.preset_at(row) for row in range(self.model.rowCount())]
+
+    def test_rows_sorted_case_insensitively(self):
+        """Test that presets are listed in case-insensitive name order"""
+        self.assertEqual(self._names(), ['alpha', 'Bravo', 'Delta'])
+        self.assertEqual(self.model.index(0, PresetTableModel.COL_ARGUMENTS).data(),
+                         'device=headphones')
+
+    def test_added_preset_inserted_at_sorted_row(self):
+        """Test that a new preset is inserted in place at its sorted position"""
+        inserted_spy = QSignalSpy(self.model.rowsInserted)
+
+        self.model.update_presets(dict(self.presets, charlie={'device': 'tv'}))
+
+        self.assertEqual(self._names(), ['alpha', 'Bravo', 'charlie', 'Delta'])
+        self.assertEqual(len(inserted_spy), 1)
+        self.assertEqual((inserted_spy[0][1], inserted_spy[0][2]), (2, 2))
+        self.assertEqual(len(self.reset_spy), 0)
+
+    def test_edited_preset_updates_arguments_cell(self):
+        """Test that an edit only reports the ARGUMENTS cell of its row"""
+        changed_spy = QSignalSpy(self.model.dataChanged)
+
+        self.model.update_presets(dict(self.presets, Bravo={'device': 'monitor'}))
+
+        self.assertEqual(len(changed_spy), 1)
+        index = changed_spy[0][0]
+        self.assertEqual((index.row(), index.column()), (1, PresetTableModel.COL_ARGUMENTS))
+        self.assertEqual(self.model.index(1, PresetTableModel.COL_ARGUMENTS).data(),
+                         'device=monitor')
+        self.assertEqual(len(self.reset_spy), 0)
+
+    def test_removed_preset_row_dropped(self):
+        """Test that a deleted preset removes only its row"""
+        removed_spy = QSignalSpy(self.model.rowsRemoved)
+        presets = dict(self.presets)
+        del presets['Bravo']
+
+        self.model.update_presets(presets)
+
+        self.assertEqual(self._names(), ['alpha', 'Delta'])
+        self.assertEqual(len(removed_spy), 1)
+        self.assertEqual((removed_spy[0][1], removed_spy[0][2]), (1, 1))
+        self.assertEqual(len(self.reset_spy), 0)
+
+    def test_rename_resets_model(self):
+        """Test that a rename (add plus remove) falls back to a full reset"""
+        presets = dict(self.presets)
+        presets['Echo'] = presets.pop('Bravo')
+
+        self.model.update_presets(presets)
+
+        self.assertEqual(self._names(), ['alpha', 'Delta', 'Echo'])
+        self.assertEqual(len(self.reset_spy), 1)
+
+
+class TestPresetTableKeyboard(unittest.TestCase):
+    """Test cases for operating the presets table from the keyboard"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for tests"""
+        cls.app = _app
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.view = SettingsView()
+        self.view.tab_widget.setCurrentIndex(2)  # Builds the Presets tab
+        self.view._preset_script = 'audio_toggle'
+        self.view.preset_model.set_presets({'Headphones': {}, 'Speakers': {}})
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.view.deleteLater()
+
+    def _press(self, row, key):
+        table = self.view.preset_table
+        table.setCurrentIndex(self.view.preset_model.index(row, PresetTableModel.COL_NAME))
+        QTest.keyClick(table, key)
+
+    def test_enter_edits_current_preset(self):
+        """Test that Enter edits the preset on the current row"""
+        spy = QSignalSpy(self.view.edit_preset_requested)
+
+        self._press(1, Qt.Key.Key_Return)
+
+        self.assertEqual(len(spy), 1)
+        self.assertEqual(spy[0], ['audio_toggle', 'Speakers'])
+
+    def test_delete_key_deletes_current_preset(self):
+        """Test that Delete asks for confirmation and deletes the current preset"""
+        spy = QSignalSpy(self.view.preset_deleted)
+
+        with patch('views.settings_view.QMessageBox.question',
+                   return_value=QMessageBox.StandardButton.Yes) as mock_question:
+            self._press(0, Qt.Key.Key_Delete)
+
+        mock_question.assert_called_once()
+        self.assertEqual(len(spy), 1)
+        self.assertEqual(spy[0], ['audio_toggle', 'Headphones'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit tests for TrayView.
+
+These tests build the tray menu on the offscreen platform and check
+that it is populated without the menu ever being shown.
+"""
+import unittest
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtTest import QSignalSpy
+from views.tray_view import TrayView
+
+# Menus need a QApplication; create it at import time, before other test
+# modules can create a plain QCoreApplication in their setUpClass
+_app = QApplication.instance() or QApplication([])
+
+
+def _menu_structure(*names):
+    """Menu structure with one keyed action item per script name"""
+    return {
+        'title': 'Desktop Utilities',
+        'items': [
+            {
+                'type': 'action',
+                'text': name,
+                'enabled': True,
+                'data': {'type': 'script', 'script_name': name},
+                'key': name,
+            }
+            for name in names
+        ],
+    }
+
+
+class TestTrayView(unittest.TestCase):
+    """Test cases for TrayView"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for tests"""
+        cls.app = _app
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.view = TrayView()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.view.cleanup()
+
+    def _script_actions(self):
+        """Script item actions in menu order"""
+        entry_actions = {action for _, action in self.view._menu_entries}
+        return [action for action in self.view.context_menu.actions() if action in entry_actions]
+
+    def test_menu_built_without_being_shown(self):
+        """Test that the menu has items after an update, without aboutToShow"""
+        self.view.update_menu_structure(_menu_structure('Alpha', 'Beta'))
+        QApplication.processEvents()
+
+        self.assertEqual([action.text() for action in self._script_actions()], ['Alpha', 'Beta'])
+        texts = [action.text() for action in self.view.context_menu.actions()]
+        self.assertIn('Desktop Utilities', texts)
+        self.assertIn('Exit', texts)
+
+    def test_burst_of_updates_builds_latest(self):
+        """Test that several updates before the event loop runs build the last one"""
+        self.view.update_menu_structure(_menu_structure('Alpha'))
+        self.view.update_menu_structure(_menu_structure('Alpha', 'Beta', 'Gamma'))
+        QApplication.processEvents()
+
+        self.assertEqual([action.text() for action in self._script_actions()],
+                         ['Alpha', 'Beta', 'Gamma'])
+
+    def test_reorder_by_key_keeps_action_data(self):
+        """Test that reordering items by key keeps each action bound to its data"""
+        self.view.update_menu_structure(_menu_structure('Alpha', 'Beta', 'Gamma'))
+        QApplication.processEvents()
+        actions_by_text = {action.text(): action for action in self._script_actions()}
+
+        # A removed item changes the layout, so items are matched by key
+        self.view.update_menu_structure(_menu_structure('Gamma', 'Alpha'))
+        QApplication.processEvents()
+
+        actions = self._script_actions()
+        self.assertEqual([action.text() for action in actions], ['Gamma', 'Alpha'])
+        self.assertIs(actions[0], actions_by_text['Gamma'])
+        self.assertIs(actions[1], actions_by_text['Alpha'])
+
+        spy = QSignalSpy(self.view.menu_action_triggered)
+        for action in actions:
+            action.trigger()
+        self.assertEqual([args[0]['script_name'] for args in spy], ['Gamma', 'Alpha'])
+
+
+if __name__ == '__main__':
+    unittest.main()
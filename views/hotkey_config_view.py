@@ -28,6 +28,16 @@ IGNORED_KEYS = {
 }
 
 
+def _set_style_property(widget, name: str, value) -> None:
+    """Set a dynamic property used by a stylesheet selector and repolish."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
 class HotkeyRecorderWidget(QLineEdit):
     """Custom line edit widget that records key combinations"""
     
@@ -180,12 +190,12 @@ class HotkeyRecorderWidget(QLineEdit):
         self.current_key = None
         self.setText("Press a key combination...")
         self.setFocus()
-        self.setStyleSheet("background-color: #2a2a2a; border: 2px solid #4a90e2;")
+        _set_style_property(self, "recording", True)
     
     def stop_recording(self):
         """Stop recording key combinations"""
         self.recording = False
-        self.setStyleSheet("")
+        _set_style_property(self, "recording", False)
     
     def mousePressEvent(self, event):
         """Handle mouse clicks to start recording"""
@@ -268,7 +278,7 @@ class HotkeyConfigView(QDialog):
             "Use Ctrl, Alt, Shift, or Win as modifiers."
         )
         instructions.setWordWrap(True)
-        instructions.setStyleSheet("color: #999;")
+        instructions.setProperty("class", "secondary")
         layout.addWidget(instructions)
         
         # Hotkey recorder
@@ -280,7 +290,6 @@ class HotkeyConfigView(QDialog):
         
         # Validation label
         self.validation_label = QLabel("")
-        self.validation_label.setStyleSheet("color: #ff6b6b;")
         self.validation_label.setVisible(False)
         layout.addWidget(self.validation_label)
         
@@ -307,18 +316,19 @@ class HotkeyConfigView(QDialog):
     def show_validation_error(self, message: str):
         """Show a validation error message"""
         self.validation_label.setText(message)
+        _set_style_property(self.validation_label, "severity", "error")
         self.validation_label.setVisible(True)
     
     def show_validation_warning(self, message: str):
         """Show a validation warning message"""
         self.validation_label.setText(message)
-        self.validation_label.setStyleSheet("color: #ffa500;")
+        _set_style_property(self.validation_label, "severity", "warning")
         self.validation_label.setVisible(True)
     
     def clear_validation(self):
         """Clear any validation messages"""
         self.validation_label.setVisible(False)
-        self.validation_label.setStyleSheet("color: #ff6b6b;")
+        _set_style_property(self.validation_label, "severity", "error")
     
     def clear_hotkey(self):
         """Clear the current hotkey"""
@@ -95,6 +95,17 @@ class ArgumentWidget(QWidget):
         elif isinstance(self.value_widget, QLineEdit):
             self.value_widget.setText(str(value) if value is not None else "")
     
+    def clear_value(self):
+        """Restore the value a newly created widget starts with"""
+        if isinstance(self.value_widget, QComboBox):
+            self.value_widget.setCurrentIndex(0 if self.value_widget.count() else -1)
+        elif isinstance(self.value_widget, QCheckBox):
+            self.value_widget.setChecked(False)
+        elif isinstance(self.value_widget, (QSpinBox, QDoubleSpinBox)):
+            self.value_widget.setValue(0)
+        elif isinstance(self.value_widget, QLineEdit):
+            self.value_widget.clear()
+    
     def get_value(self) -> Any:
         """Get the widget value"""
         if isinstance(self.value_widget, QComboBox):
@@ -181,7 +192,7 @@ class PresetEditorView(QDialog):
                 self.args_layout.addWidget(arg_widget)
         else:
             no_args_label = QLabel("This script has no configurable arguments")
-            no_args_label.setStyleSheet("color: #999;")
+            no_args_label.setProperty("class", "secondary")
             self.args_layout.addWidget(no_args_label)
         
         self.args_layout.addStretch()
@@ -204,17 +215,25 @@ class PresetEditorView(QDialog):
             pass
         
         # Pre-fill for edit
-        if self.initial_name:
-            self.preset_name_edit.setText(self.initial_name)
-        for arg_name, arg_widget in self.argument_widgets.items():
-            if arg_name in self.initial_args:
-                arg_widget.set_value(self.initial_args[arg_name])
+        self.load_preset(self.initial_name, self.initial_args)
 
         # Dialog buttons
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
     
+    def load_preset(self, preset_name: Optional[str] = None,
+                    arguments: Optional[Dict[str, Any]] = None):
+        """Show a preset for editing (or a blank one), reusing the existing widgets."""
+        self.initial_name = preset_name
+        self.initial_args = arguments or {}
+        self.preset_name_edit.setText(preset_name or "")
+        for arg_name, arg_widget in self.argument_widgets.items():
+            if arg_name in self.initial_args:
+                arg_widget.set_value(self.initial_args[arg_name])
+            else:
+                arg_widget.clear_value()
+    
     # No preset selection here; handled by Settings -> Script Args
     
     def on_argument_changed(self, arg_name: str, value: Any):
@@ -4,20 +4,379 @@ Settings View - UI component for application settings.
 This view provides the settings dialog interface without business logic,
 emitting signals for user interactions and updating display based on controller data.
 """
+import bisect
 import logging
+import os
 from typing import Dict, Any, List, Optional
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QCheckBox,
     QLabel, QPushButton, QWidget, QTabWidget,
-    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
+    QTableView, QHeaderView, QAbstractItemView,
     QSpinBox, QComboBox, QListWidget, QListWidgetItem, QMessageBox,
-    QFileDialog, QInputDialog, QFrame
+    QFileDialog, QInputDialog, QFrame, QStyledItemDelegate, QStyle, QToolTip
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QIcon, QAction
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex, QSignalBlocker, QEvent, QRect
+)
+from PyQt6.QtGui import QIcon, QAction, QColor, QPalette
 
 logger = logging.getLogger('Views.Settings')
 
+# Formats an (argument, value) pair for the presets table
+_format_arg_pair = "{0[0]}={0[1]}".format
+
+# Item data role flagging cells that belong to a disabled script row
+DISABLED_ROW_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Keys that press the button-like cell under the keyboard cursor
+_ACTIVATION_KEYS = (Qt.Key.Key_Return, Qt.Key.Key_Enter, Qt.Key.Key_Space)
+
+# Presets table keys and the ACTION cell button each one presses
+_PRESET_KEY_ACTIONS = dict.fromkeys(_ACTIVATION_KEYS, "Edit")
+_PRESET_KEY_ACTIONS[Qt.Key.Key_Delete] = "Delete"
+
+
+class ScriptRowDelegate(QStyledItemDelegate):
+    """Paints cells of disabled script rows in the stylesheet's disabled color."""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.data(DISABLED_ROW_ROLE):
+            option.state &= ~QStyle.StateFlag.State_Enabled
+
+
+class ScriptTableModel(QAbstractTableModel):
+    """
+    Table model backing the Scripts tab.
+
+    Rows are the script dicts supplied by the controller; cell text and
+    tooltips are derived on demand in data(), so only visible cells cost
+    anything to display.
+    """
+
+    COL_ACTION, COL_DISPLAY_NAME, COL_FILENAME, COL_HOTKEY = range(4)
+    HEADERS = ("ACTION", "DISPLAY NAME", "FILENAME", "HOTKEY")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._scripts: List[Dict[str, Any]] = []
+        self._file_names: List[str] = []
+
+    def set_scripts(self, scripts: List[Dict[str, Any]]):
+        """Replace all rows."""
+        self.beginResetModel()
+        self._set_rows(scripts)
+        self.endResetModel()
+
+    def update_scripts(self, scripts: List[Dict[str, Any]]):
+        """Replace rows with the same scripts in the same order, keeping view state.
+
+        Only rows whose data actually changed are reported to the view.
+        """
+        old_scripts = self._scripts
+        self._set_rows(scripts)
+        for row, (old, new) in enumerate(zip(old_scripts, scripts)):
+            if old != new:
+                self.refresh_rows(row, row)
+
+    def _set_rows(self, scripts: List[Dict[str, Any]]):
+        self._scripts = scripts
+        # FILENAME text is derived once per update rather than on every repaint
+        self._file_names = [
+            os.path.basename(script['file_path']) if script.get('file_path') else script.get('name', '')
+            for script in scripts
+        ]
+
+    def refresh_rows(self, first: int = 0, last: Optional[int] = None,
+                     column: Optional[int] = None):
+        """Notify views that rows first..last changed (defaults to all rows).
+
+        Pass column to limit the notification to a single column.
+        """
+        if not self._scripts:
+            return
+        if last is None:
+            last = len(self._scripts) - 1
+        first_col = 0 if column is None else column
+        last_col = len(self.HEADERS) - 1 if column is None else column
+        self.dataChanged.emit(self.index(first, first_col), self.index(last, last_col))
+
+    def script_at(self, row: int) -> Optional[Dict[str, Any]]:
+        if 0 <= row < len(self._scripts):
+            return self._scripts[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._scripts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        script = self._scripts[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == self.COL_ACTION:
+                if script['is_external']:
+                    return "Remove"
+                return "Enable" if script.get('is_disabled') else "Disable"
+            if col == self.COL_DISPLAY_NAME:
+                return script.get('custom_name') or 'Click to set'
+            if col == self.COL_FILENAME:
+                # Explicitly show the underlying file name
+                return self._file_names[index.row()]
+            return script.get('hotkey') or 'Click to set'
+
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if col == self.COL_ACTION:
+                if script['is_external']:
+                    return f"Remove external script: {script['display_name']}"
+                return "Enable this script" if script.get('is_disabled') else "Disable this script"
+            if col == self.COL_DISPLAY_NAME:
+                custom_name = script.get('custom_name')
+                return f"Custom name: {custom_name}" if custom_name else "Click to set a custom display name"
+            if col == self.COL_FILENAME:
+                # Full path and current display name for clarity
+                tooltip_parts = []
+                if script.get('file_path'):
+                    tooltip_parts.append(f"Path: {script['file_path']}")
+                if script.get('display_name'):
+                    tooltip_parts.append(f"Display: {script['display_name']}")
+                return "\n".join(tooltip_parts) or None
+            hotkey = script.get('hotkey')
+            if hotkey:
+                return f"Current hotkey: {hotkey}\nClick to change"
+            return "No hotkey set. Click to change"
+
+        if role == DISABLED_ROW_ROLE:
+            # Action cell stays live so disabled scripts can be re-enabled
+            return col != self.COL_ACTION and bool(script.get('is_disabled'))
+
+        return None
+
+
+class PresetTableModel(QAbstractTableModel):
+    """
+    Table model backing the Presets tab.
+
+    Rows are the presets of the selected script in case-insensitive name
+    order; the ACTION column is painted by PresetActionDelegate.
+    """
+
+    COL_ACTION, COL_NAME, COL_ARGUMENTS = range(3)
+    HEADERS = ("ACTION", "PRESET NAME", "ARGUMENTS")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: List[str] = []
+        # Formatted "arg=value" pairs per row, and their display text
+        self._arg_pairs: List[tuple] = []
+        self._arg_texts: List[str] = []
+        # Formatted rows per script, reused when the combo switches back to it
+        self._rows_cache: Dict[str, tuple] = {}
+
+    @staticmethod
+    def sort_key(preset_name: str) -> str:
+        """Stable, case-insensitive ordering for preset rows."""
+        return preset_name.lower()
+
+    @staticmethod
+    def _format_args(args: Optional[Dict[str, Any]]) -> tuple:
+        return tuple(map(_format_arg_pair, (args or {}).items()))
+
+    def set_presets(self, presets: Optional[Dict[str, Any]], cache_key: Optional[str] = None):
+        """Replace all rows, reusing the rows formatted earlier under cache_key."""
+        rows = self._rows_cache.get(cache_key) if cache_key else None
+        if rows is None:
+            presets = presets or {}
+            names = sorted(presets.keys(), key=self.sort_key)
+            arg_pairs = [self._format_args(presets[name]) for name in names]
+            rows = (names, arg_pairs, list(map(", ".join, arg_pairs)))
+            if cache_key:
+                self._rows_cache[cache_key] = rows
+        self.beginResetModel()
+        # Copies: update_presets edits the live rows in place
+        self._names, self._arg_pairs, self._arg_texts = (list(r) for r in rows)
+        self.endResetModel()
+
+    def discard_cached(self, cache_key: Optional[str] = None):
+        """Forget cached rows for one key, or for all keys."""
+        if cache_key is None:
+            self._rows_cache.clear()
+        else:
+            self._rows_cache.pop(cache_key, None)
+
+    def update_presets(self, presets: Optional[Dict[str, Any]]):
+        """Apply an edit/add/delete in place instead of resetting the model."""
+        presets = presets or {}
+        old_names = set(self._names)
+        added = set(presets.keys()) - old_names
+        removed = old_names - set(presets.keys())
+        if len(added) > 1 or (added and removed):
+            # Renames and bulk changes (e.g. auto-generate) take the full path
+            self.set_presets(presets)
+            return
+
+        # Deleted presets: drop their rows, bottom-up so indices stay valid
+        for row in sorted((self._names.index(n) for n in removed), reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._names[row]
+            del self._arg_pairs[row]
+            del self._arg_texts[row]
+            self.endRemoveRows()
+
+        # Edited presets: only the ARGUMENTS cell can change
+        for row, preset_name in enumerate(self._names):
+            arg_pairs = self._format_args(presets[preset_name])
+            if arg_pairs != self._arg_pairs[row]:
+                self._arg_pairs[row] = arg_pairs
+                self._arg_texts[row] = ", ".join(arg_pairs)
+                index = self.index(row, self.COL_ARGUMENTS)
+                self.dataChanged.emit(index, index)
+
+        # New preset: insert at its sorted position
+        for preset_name in added:
+            keys = [self.sort_key(n) for n in self._names]
+            row = bisect.bisect_right(keys, self.sort_key(preset_name))
+            self.beginInsertRows(QModelIndex(), row, row)
+            arg_pairs = self._format_args(presets[preset_name])
+            self._names.insert(row, preset_name)
+            self._arg_pairs.insert(row, arg_pairs)
+            self._arg_texts.insert(row, ", ".join(arg_pairs))
+            self.endInsertRows()
+
+    def preset_at(self, row: int) -> Optional[str]:
+        if 0 <= row < len(self._names):
+            return self._names[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == self.COL_NAME:
+                return self._names[row]
+            if col == self.COL_ARGUMENTS:
+                # Compact; the tooltip shows the full list
+                return self._arg_texts[row]
+            return None
+
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if col == self.COL_NAME:
+                return f"Preset: {self._names[row]}"
+            if col == self.COL_ARGUMENTS:
+                return "\n".join(self._arg_pairs[row]) or None
+            return None
+
+        return None
+
+
+class PresetActionDelegate(QStyledItemDelegate):
+    """Paints the presets ACTION cell as flat Edit/Delete buttons and reports clicks."""
+
+    ACTIONS = ("Edit", "Delete")
+    HOVER_COLOR = QColor("#5A5B64")
+
+    action_clicked = pyqtSignal(int, str)  # row, action
+
+    def __init__(self, view: QTableView):
+        super().__init__(view)
+        self._view = view
+        # (row, action index) under the mouse, if any
+        self._hovered = None
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    def _action_rects(self, rect: QRect) -> List[QRect]:
+        """Split a cell into equal-width button areas."""
+        width = rect.width() // len(self.ACTIONS)
+        return [
+            QRect(rect.left() + i * width, rect.top(), width, rect.height())
+            for i in range(len(self.ACTIONS))
+        ]
+
+    def _action_at(self, index: QModelIndex, pos) -> int:
+        """Index into ACTIONS under pos in the view's viewport, or -1."""
+        if not index.isValid() or index.column() != PresetTableModel.COL_ACTION:
+            return -1
+        for i, rect in enumerate(self._action_rects(self._view.visualRect(index))):
+            if rect.contains(pos):
+                return i
+        return -1
+
+    def paint(self, painter, option, index):
+        # Cell background, selection and grid come from the normal item painting
+        super().paint(painter, option, index)
+        painter.save()
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        for i, rect in enumerate(self._action_rects(option.rect)):
+            if self._hovered == (index.row(), i):
+                painter.fillRect(rect, self.HOVER_COLOR)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.ACTIONS[i])
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            action = self._action_at(index, event.position().toPoint())
+            if action >= 0:
+                self.action_clicked.emit(index.row(), self.ACTIONS[action])
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        action = self._action_at(index, event.pos())
+        if action < 0:
+            return super().helpEvent(event, view, option, index)
+        preset_name = index.siblingAtColumn(PresetTableModel.COL_NAME).data()
+        QToolTip.showText(event.globalPos(), f"{self.ACTIONS[action]} preset '{preset_name}'", view)
+        return True
+
+    def eventFilter(self, obj, event):
+        """Track which button the mouse is over to paint its hover state."""
+        if event.type() in (QEvent.Type.MouseMove, QEvent.Type.Leave):
+            hovered = None
+            if event.type() == QEvent.Type.MouseMove:
+                pos = event.position().toPoint()
+                index = self._view.indexAt(pos)
+                action = self._action_at(index, pos)
+                if action >= 0:
+                    hovered = (index.row(), action)
+            if hovered != self._hovered:
+                model = self._view.model()
+                for entry in (self._hovered, hovered):
+                    if entry is not None:
+                        cell = model.index(entry[0], PresetTableModel.COL_ACTION)
+                        self._view.viewport().update(self._view.visualRect(cell))
+                self._hovered = hovered
+                if hovered is None:
+                    self._view.viewport().unsetCursor()
+                else:
+                    self._view.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        return super().eventFilter(obj, event)
+
 
 class SettingsView(QDialog):
     """
@@ -63,13 +422,22 @@ class SettingsView(QDialog):
     
     # Dialog actions (instant-apply mode: no OK/Cancel buttons)
     
+    # Folder the external-script picker last selected from; shared by every
+    # settings dialog opened during this session
+    _last_script_dir = ""
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         # UI components
         self.tab_widget = None
         self.script_table = None
+        self.script_model = None
         self.preset_table = None
+        self.preset_model = None
+        self.preset_script_combo = None
+        # Script whose presets the table shows (the combo's current text)
+        self._preset_script = ""
         
         # Checkboxes for settings
         self.run_on_startup_checkbox = None
@@ -87,6 +455,28 @@ class SettingsView(QDialog):
         self._script_data = []
         self._preset_data = {}
         
+        # Coalesces bursts of script list updates into one table rebuild
+        self._refresh_pending = False
+        # Message boxes waiting for the current handler to return
+        self._pending_messages = []
+        # Row keys currently shown in the scripts table (see _script_row_key)
+        self._displayed_scripts = []
+        # Script stem / original display name -> index into _script_data (and table row)
+        self._row_by_name = {}
+        self._row_by_original_name = {}
+        
+        # Built tab pages whose contents are refreshed only while on screen
+        self._scripts_page = None
+        self._presets_page = None
+        # Page -> refresh deferred until that page is next shown
+        self._stale_pages = {}
+        
+        # Saves the timeout once the spinbox settles instead of on every step
+        self._timeout_save_timer = QTimer(self)
+        self._timeout_save_timer.setSingleShot(True)
+        self._timeout_save_timer.setInterval(250)
+        self._timeout_save_timer.timeout.connect(self._flush_timeout_save)
+        
         self._init_ui()
         
         logger.info("SettingsView initialized")
@@ -104,17 +494,69 @@ class SettingsView(QDialog):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # Create tabs
-        self._create_general_tab()
-        self._create_scripts_tab()
-        self._create_presets_tab()
-        self._create_reset_tab()
+        # Create tab pages; contents are built the first time a tab is shown
+        self._tab_builders = {}
+        for title, builder in (
+            ("General", self._create_general_tab),
+            ("Scripts", self._create_scripts_tab),
+            ("Presets", self._create_presets_tab),
+            ("Reset", self._create_reset_tab),
+        ):
+            page = QWidget()
+            index = self.tab_widget.addTab(page, title)
+            self._tab_builders[index] = (builder, page)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tab_widget.currentIndex())
+        self.tab_widget.currentChanged.connect(self._refresh_stale_page)
         
         # Instant-apply: remove OK/Cancel; window can be closed via title bar
     
-    def _create_general_tab(self):
+    def _ensure_tab_built(self, index: int):
+        """Build a tab's contents on first activation."""
+        entry = self._tab_builders.pop(index, None)
+        if entry is None:
+            return
+        builder, page = entry
+        builder(page)
+        if not self._tab_builders:
+            # Every tab is built; stop listening for tab switches
+            self.tab_widget.currentChanged.disconnect(self._ensure_tab_built)
+    
+    def _defer_until_shown(self, page: Optional[QWidget], refresh) -> bool:
+        """Queue refresh for when page is next shown; False if it is showing now."""
+        if page is None or (self.isVisible() and self.tab_widget.currentWidget() is page):
+            return False
+        self._stale_pages[page] = refresh
+        return True
+    
+    def _refresh_stale_page(self, index: int):
+        """Run the refresh deferred for the tab at index, if any."""
+        refresh = self._stale_pages.pop(self.tab_widget.widget(index), None)
+        if refresh is not None:
+            refresh()
+    
+    def showEvent(self, event):
+        """Catch up the current tab on updates that arrived while hidden."""
+        super().showEvent(event)
+        self._refresh_stale_page(self.tab_widget.currentIndex())
+    
+    def _on_timeout_changed(self, _value: int):
+        """Restart the timeout save debounce."""
+        self._timeout_save_timer.start()
+    
+    def _flush_timeout_save(self):
+        """Emit the settled timeout value."""
+        self._timeout_save_timer.stop()
+        self.script_timeout_changed.emit(self.timeout_spinbox.value())
+    
+    def done(self, result: int):
+        """Save any pending timeout edit before the dialog closes."""
+        if self._timeout_save_timer.isActive():
+            self._flush_timeout_save()
+        super().done(result)
+    
+    def _create_general_tab(self, tab: QWidget):
         """Create the General settings tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Startup Settings Group
@@ -169,7 +611,7 @@ class SettingsView(QDialog):
         self.timeout_spinbox = QSpinBox()
         self.timeout_spinbox.setMinimum(5)
         self.timeout_spinbox.setMaximum(300)
-        self.timeout_spinbox.valueChanged.connect(self.script_timeout_changed.emit)
+        self.timeout_spinbox.valueChanged.connect(self._on_timeout_changed)
         timeout_layout.addWidget(self.timeout_spinbox)
         timeout_layout.addStretch()
         execution_layout.addLayout(timeout_layout)
@@ -179,11 +621,9 @@ class SettingsView(QDialog):
         
         layout.addStretch()
         
-        self.tab_widget.addTab(tab, "General")
     
-    def _create_scripts_tab(self):
+    def _create_scripts_tab(self, tab: QWidget):
         """Create the Scripts management tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Instructions
@@ -194,11 +634,9 @@ class SettingsView(QDialog):
         layout.addWidget(instructions)
         
         # Scripts table
-        self.script_table = QTableWidget()
-        self.script_table.setColumnCount(4)
-        self.script_table.setHorizontalHeaderLabels([
-            "ACTION", "DISPLAY NAME", "FILENAME", "HOTKEY"
-        ])
+        self.script_model = ScriptTableModel(self)
+        self.script_table = QTableView()
+        self.script_table.setModel(self.script_model)
         
         # Configure table
         self.script_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -207,7 +645,15 @@ class SettingsView(QDialog):
         self.script_table.verticalHeader().setVisible(False)  # Hide row numbers
         self.script_table.setShowGrid(True)  # Show grid lines for clarity
         self.script_table.setWordWrap(False)  # Prevent widgets/text from wrapping across columns
-        # Ensure readable row height similar to item rows
+        self.script_table.setItemDelegate(ScriptRowDelegate(self.script_table))
+        # ACTION, DISPLAY NAME and HOTKEY cells act as buttons
+        self.script_table.setMouseTracking(True)
+        self.script_table.entered.connect(self._on_script_cell_hovered)
+        self.script_table.viewportEntered.connect(self.script_table.viewport().unsetCursor)
+        self.script_table.clicked.connect(self._on_script_cell_clicked)
+        # Enter/Space press the current cell, so the table works from the keyboard
+        self.script_table.installEventFilter(self)
+        # Uniform, fixed row height: rows are never measured individually
         vh = self.script_table.verticalHeader()
         try:
             vh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
@@ -228,13 +674,6 @@ class SettingsView(QDialog):
         # Set proper column widths to prevent truncation and overlapping
         self.script_table.setColumnWidth(0, 110)   # ACTION - button width
         self.script_table.setColumnWidth(3, 200)   # HOTKEY - show full hotkeys
-
-        # Provide initial proportions for stretch columns
-        try:
-            header.resizeSection(1, 280)  # Display name
-            header.resizeSection(2, 240)  # Filename
-        except Exception:
-            pass
         
         layout.addWidget(self.script_table)
         
@@ -251,11 +690,13 @@ class SettingsView(QDialog):
         
         layout.addLayout(button_layout)
         
-        self.tab_widget.addTab(tab, "Scripts")
+        # Show any script data that arrived before the tab was built
+        self._refresh_script_table()
+        self._scripts_page = tab
+        
     
-    def _create_presets_tab(self):
+    def _create_presets_tab(self, tab: QWidget):
         """Create the Script Presets/Arguments tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Instructions
@@ -277,11 +718,12 @@ class SettingsView(QDialog):
         layout.addLayout(script_layout)
         
         # Presets table (styled like Scripts tab)
-        self.preset_table = QTableWidget()
-        self.preset_table.setColumnCount(3)
-        self.preset_table.setHorizontalHeaderLabels([
-            "ACTION", "PRESET NAME", "ARGUMENTS"
-        ])
+        self.preset_table = QTableView()
+        self.preset_model = PresetTableModel(self.preset_table)
+        self.preset_table.setModel(self.preset_model)
+        preset_action_delegate = PresetActionDelegate(self.preset_table)
+        preset_action_delegate.action_clicked.connect(self._on_preset_action_clicked)
+        self.preset_table.setItemDelegateForColumn(PresetTableModel.COL_ACTION, preset_action_delegate)
 
         # Configure table for consistent look
         self.preset_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -290,7 +732,7 @@ class SettingsView(QDialog):
         self.preset_table.verticalHeader().setVisible(False)
         self.preset_table.setShowGrid(True)
         self.preset_table.setWordWrap(False)
-        # Ensure readable row height similar to item rows
+        # Uniform, fixed row height: rows are never measured individually
         p_vh = self.preset_table.verticalHeader()
         try:
             p_vh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
@@ -307,14 +749,11 @@ class SettingsView(QDialog):
         p_header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # PRESET NAME
         p_header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)  # ARGUMENTS
         self.preset_table.setColumnWidth(0, 160)  # Room for Edit/Delete buttons
-        try:
-            p_header.resizeSection(1, 240)
-            p_header.resizeSection(2, 420)
-        except Exception:
-            pass
 
         # Double-click to edit preset
-        self.preset_table.cellDoubleClicked.connect(lambda r, c: self._on_edit_preset())
+        self.preset_table.doubleClicked.connect(self._on_preset_double_clicked)
+        # Enter/Space edit and Delete deletes the current preset from the keyboard
+        self.preset_table.installEventFilter(self)
 
         layout.addWidget(self.preset_table)
         
@@ -335,7 +774,10 @@ class SettingsView(QDialog):
         
         layout.addLayout(button_layout)
         
-        self.tab_widget.addTab(tab, "Presets")
+        # Show any script/preset data that arrived before the tab was built
+        self._update_preset_script_combo()
+        self._presets_page = tab
+        
 
     def select_presets_tab(self):
         """Switch to the Presets tab."""
@@ -347,9 +789,8 @@ class SettingsView(QDialog):
         except Exception:
             pass
     
-    def _create_reset_tab(self):
+    def _create_reset_tab(self, tab: QWidget):
         """Create the Reset settings tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Warning
@@ -357,7 +798,7 @@ class SettingsView(QDialog):
             "âš ï¸ Warning: Reset operations cannot be undone!\n\n"
             "Choose what you want to reset:"
         )
-        warning.setStyleSheet("color: orange;")
+        warning.setProperty("class", "warning")
         layout.addWidget(warning)
         # Ensure clean ASCII text in case of encoding glitches in literals
         warning.setText(
@@ -384,31 +825,67 @@ class SettingsView(QDialog):
         
         layout.addStretch()
         
-        self.tab_widget.addTab(tab, "Reset")
     
     # Update slots (called by controller)
     def update_startup_settings(self, settings: Dict[str, Any]):
         """Update startup settings display"""
-        self.run_on_startup_checkbox.setChecked(settings.get('run_on_startup', False))
-        self.start_minimized_checkbox.setChecked(settings.get('start_minimized', True))
-        self.show_notification_checkbox.setChecked(settings.get('show_notification', True))
+        # Block signals so loaded values are not echoed back to the controller
+        with QSignalBlocker(self.run_on_startup_checkbox), \
+                QSignalBlocker(self.start_minimized_checkbox), \
+                QSignalBlocker(self.show_notification_checkbox):
+            self.run_on_startup_checkbox.setChecked(settings.get('run_on_startup', False))
+            self.start_minimized_checkbox.setChecked(settings.get('start_minimized', True))
+            self.show_notification_checkbox.setChecked(settings.get('show_notification', True))
     
     def update_behavior_settings(self, settings: Dict[str, Any]):
         """Update behavior settings display"""
-        self.minimize_to_tray_checkbox.setChecked(settings.get('minimize_to_tray', True))
-        self.close_to_tray_checkbox.setChecked(settings.get('close_to_tray', True))
-        self.single_instance_checkbox.setChecked(settings.get('single_instance', True))
-        self.show_script_notifications_checkbox.setChecked(
-            settings.get('show_script_notifications', True)
-        )
+        with QSignalBlocker(self.minimize_to_tray_checkbox), \
+                QSignalBlocker(self.close_to_tray_checkbox), \
+                QSignalBlocker(self.single_instance_checkbox), \
+                QSignalBlocker(self.show_script_notifications_checkbox):
+            self.minimize_to_tray_checkbox.setChecked(settings.get('minimize_to_tray', True))
+            self.close_to_tray_checkbox.setChecked(settings.get('close_to_tray', True))
+            self.single_instance_checkbox.setChecked(settings.get('single_instance', True))
+            self.show_script_notifications_checkbox.setChecked(
+                settings.get('show_script_notifications', True)
+            )
     
     def update_execution_settings(self, settings: Dict[str, Any]):
         """Update execution settings display"""
-        self.timeout_spinbox.setValue(settings.get('script_timeout_seconds', 30))
+        with QSignalBlocker(self.timeout_spinbox):
+            self.timeout_spinbox.setValue(settings.get('script_timeout_seconds', 30))
     
     def update_script_list(self, scripts: List[Dict[str, Any]]):
         """Update the scripts table"""
+        if scripts == self._script_data:
+            # Same scripts with the same state; nothing to redraw
+            return
         self._script_data = scripts
+        self._row_by_name = {}
+        self._row_by_original_name = {}
+        for row, script in enumerate(scripts):
+            self._row_by_name[script.get('name')] = row
+            self._row_by_original_name[
+                script.get('original_display_name', script.get('display_name'))
+            ] = row
+        self.request_refresh_scripts()
+
+    def _find_row(self, script_name: str) -> int:
+        """Return the row for a script stem, or -1 if it is not listed."""
+        return self._row_by_name.get(script_name, -1)
+
+    def request_refresh_scripts(self):
+        """Schedule a single scripts table rebuild for the next event-loop tick."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Run a pending scripts table rebuild, if any."""
+        if not self._refresh_pending:
+            return
+        self._refresh_pending = False
         self._refresh_script_table()
         self._update_preset_script_combo()
 
@@ -417,227 +894,137 @@ class SettingsView(QDialog):
 
         script_name is the file stem identifier (matches script dict 'name').
         """
-        # Find the script row
-        row_index = -1
-        for i, script in enumerate(self._script_data):
-            if script.get('name') == script_name:
-                row_index = i
-                # update backing data
-                script['hotkey'] = hotkey
-                break
-
+        row_index = self._find_row(script_name)
         if row_index < 0:
             # Script not found in current view; nothing to update
             return
+        # update backing data
+        self._script_data[row_index]['hotkey'] = hotkey
 
-        # Update the HOTKEY cell's button text and tooltip
-        widget = self.script_table.cellWidget(row_index, 3)
-        btn = None
-        # Support either direct QPushButton or a container with a child button
-        if isinstance(widget, QPushButton):
-            btn = widget
-        elif widget is not None:
-            try:
-                btn = widget.findChild(QPushButton)
-            except Exception:
-                btn = None
-        if isinstance(btn, QPushButton):
-            new_text = hotkey if hotkey else 'Click to set'
-            btn.setText(new_text)
-            if hotkey:
-                btn.setToolTip(f"Current hotkey: {hotkey}\nClick to change")
-            else:
-                btn.setToolTip("No hotkey set. Click to change")
+        if self._refresh_pending or self._scripts_page in self._stale_pages:
+            # A rebuild is already queued and will pick up the new hotkey
+            return
+
+        self._update_script_row(row_index, ScriptTableModel.COL_HOTKEY)
 
     def update_preset_list(self, script_name: str, presets: Dict[str, Any]):
         """Update the preset list for a script"""
         self._preset_data[script_name] = presets
-        
-        # If this is the currently selected script, update the list
-        if self.preset_script_combo.currentText() == script_name:
-            self._refresh_preset_table(presets)
+        if self.preset_model is not None:
+            self.preset_model.discard_cached(script_name)
+        
+        # If this is the currently selected script, update the affected rows
+        if (self.preset_script_combo is not None
+                and self._presets_page not in self._stale_pages
+                and self._preset_script == script_name):
+            self._apply_preset_changes(presets)
 
     def set_all_presets(self, all_presets: Dict[str, Dict[str, Any]]):
         """Replace all preset data and refresh the presets tab."""
         self._preset_data = all_presets or {}
-        self._update_preset_script_combo()
-        current = self.preset_script_combo.currentText()
-        if current and current in self._preset_data:
-            self._refresh_preset_table(self._preset_data[current])
-        else:
-            # Clear table when nothing selected
-            self._refresh_preset_table({})
+        if self.preset_model is not None:
+            self.preset_model.discard_cached()
+        self._update_preset_script_combo(refresh_table=True)
     
     def show_error(self, title: str, message: str):
         """Show an error message"""
-        QMessageBox.critical(self, title, message)
+        self._queue_message(QMessageBox.critical, title, message)
     
     def show_info(self, title: str, message: str):
         """Show an information message"""
-        QMessageBox.information(self, title, message)
+        self._queue_message(QMessageBox.information, title, message)
+    
+    def _queue_message(self, show, title: str, message: str):
+        """Show a message box once control returns to the event loop.
+
+        Callers are usually controller handlers in the middle of a change;
+        a modal box opened synchronously would hold them (and the refresh
+        they schedule) until the user dismisses it.
+        """
+        self._pending_messages.append((show, title, message))
+        if len(self._pending_messages) == 1:
+            QTimer.singleShot(0, self._show_pending_messages)
+    
+    def _show_pending_messages(self):
+        """Show queued message boxes in the order they were requested."""
+        while self._pending_messages:
+            show, title, message = self._pending_messages[0]
+            show(self, title, message)
+            self._pending_messages.pop(0)
     
     # Internal UI update methods
     def _refresh_script_table(self):
-        """Refresh the scripts table display"""
-        # Reset table contents fully to avoid leftover widgets
-        self.script_table.clearContents()
-        self.script_table.setRowCount(len(self._script_data))
-        
-        for row, script in enumerate(self._script_data):
-            # Action button (disable or remove) - column 0
-            action_btn = QPushButton()
-            action_btn.setStyleSheet(
-                "QPushButton { background: transparent; border: none; border-radius: 0; padding: 2px 12px; margin: 0; text-align: left; }"
-                "QPushButton:hover { background: transparent; }"
-                "QPushButton:pressed { background: transparent; }"
-                "QPushButton:disabled { background: transparent; color: #6E6F78; }"
-            )
-            try:
-                from PyQt6.QtWidgets import QSizePolicy
-                action_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            except Exception:
-                pass
-            try:
-                # Constrain height to row size
-                row_h = self.script_table.verticalHeader().defaultSectionSize()
-                action_btn.setMaximumHeight(int(row_h))
-                action_btn.setMinimumHeight(0)
-                action_btn.setContentsMargins(0, 0, 0, 0)
-            except Exception:
-                pass
-            action_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        """Refresh the scripts table display.
 
+        When the same scripts are shown in the same order, the model only
+        reports changed data; otherwise it is reset.
+        """
+        if self.script_model is None:
+            # Scripts tab not built yet; it refreshes itself when first shown
+            return
+        if self._defer_until_shown(self._scripts_page, self._refresh_script_table):
+            return
+        row_keys = [self._script_row_key(script) for script in self._script_data]
+        if row_keys == self._displayed_scripts:
+            # Same rows: swap in the new dicts and repaint visible cells
+            self.script_model.update_scripts(self._script_data)
+            return
+
+        self.script_model.set_scripts(self._script_data)
+        self._displayed_scripts = row_keys
+
+    @staticmethod
+    def _script_row_key(script: Dict[str, Any]) -> tuple:
+        """Identity of a script row; rows with the same key can be updated in place."""
+        return (
+            script.get('name'),
+            script.get('original_display_name', script.get('display_name')),
+            bool(script.get('is_external')),
+        )
+
+    def _update_script_row(self, row: int, column: Optional[int] = None):
+        """Repaint a script row (or one of its cells) after its backing dict changed."""
+        if self.script_model is None:
+            return
+        self.script_model.refresh_rows(row, row, column)
+
+    def _on_script_cell_hovered(self, index):
+        """Show a pointing-hand cursor over cells that act as buttons."""
+        viewport = self.script_table.viewport()
+        if index.column() != ScriptTableModel.COL_FILENAME and not index.data(DISABLED_ROW_ROLE):
+            viewport.setCursor(Qt.CursorShape.PointingHandCursor)
+        else:
+            viewport.unsetCursor()
+
+    def _on_script_cell_clicked(self, index):
+        """Dispatch clicks on the ACTION, DISPLAY NAME and HOTKEY cells."""
+        script = self.script_model.script_at(index.row())
+        if script is None or index.data(DISABLED_ROW_ROLE):
+            return
+        col = index.column()
+        if col == ScriptTableModel.COL_ACTION:
             name_key = script.get('original_display_name', script['display_name'])
-            if script['is_external']:
-                # External: Remove script
-                action_btn.setText("Remove")
-                action_btn.setToolTip(f"Remove external script: {script['display_name']}")
-                action_btn.clicked.connect(
-                    lambda checked, s=name_key: self._on_action_clicked(s, is_external=True)
-                )
-            else:
-                # Built-in: Toggle disable/enable (determine current state at click time)
-                is_disabled = script['is_disabled']
-                action_btn.setText("Enable" if is_disabled else "Disable")
-                action_btn.setToolTip("Enable this script" if is_disabled else "Disable this script")
-                action_btn.clicked.connect(
-                    lambda checked, s=name_key: self._on_action_clicked(s, is_external=False)
-                )
-            # Make the entire cell act as the button (fills cell, no rounded edges)
-            self.script_table.setCellWidget(row, 0, action_btn)
-
-            # Display Name (customizable) - column 1
-            custom_name = script.get('custom_name', '')
-            custom_btn_text = custom_name if custom_name else 'Click to set'
-            custom_name_btn = QPushButton(custom_btn_text)
-            custom_name_btn.setStyleSheet(
-                "QPushButton { background: transparent; border: none; border-radius: 0; padding: 2px 12px; margin: 0; text-align: left; }"
-                "QPushButton:hover { background: transparent; }"
-                "QPushButton:pressed { background: transparent; }"
-                "QPushButton:disabled { background: transparent; color: #6E6F78; }"
-            )
-            try:
-                from PyQt6.QtWidgets import QSizePolicy
-                custom_name_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            except Exception:
-                pass
-            try:
-                row_h = self.script_table.verticalHeader().defaultSectionSize()
-                custom_name_btn.setMaximumHeight(int(row_h))
-                custom_name_btn.setMinimumHeight(0)
-                custom_name_btn.setContentsMargins(0, 0, 0, 0)
-            except Exception:
-                pass
-            custom_name_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            custom_name_btn.setToolTip(
-                f"Custom name: {custom_name}" if custom_name else "Click to set a custom display name"
-            )
-            custom_name_btn.clicked.connect(
-                lambda checked, s=script['name']: self._on_set_custom_name(s)
-            )
-            # Make the entire cell act as the button (fills cell, no rounded edges)
-            self.script_table.setCellWidget(row, 1, custom_name_btn)
-
-            # Filename (explicitly show the underlying file name) - column 2
-            file_name = script.get('file_path')
-            try:
-                from pathlib import Path
-                display_file = Path(file_name).name if file_name else script.get('name', '')
-            except Exception:
-                display_file = script.get('name', '')
-            file_item = QTableWidgetItem(display_file)
-            file_item.setTextAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-            # Tooltip shows full path and current display name for clarity
-            tooltip_parts = []
-            if file_name:
-                tooltip_parts.append(f"Path: {file_name}")
-            if script.get('display_name'):
-                tooltip_parts.append(f"Display: {script['display_name']}")
-            if tooltip_parts:
-                file_item.setToolTip("\n".join(tooltip_parts))
-            self.script_table.setItem(row, 2, file_item)
-            
-            # Hotkey - show full hotkey text with proper sizing
-            raw_hotkey = script.get('hotkey', '')
-            hotkey_text = raw_hotkey if raw_hotkey else 'Click to set'
-            hotkey_btn = QPushButton(hotkey_text)
-            hotkey_btn.setStyleSheet(
-                "QPushButton { background: transparent; border: none; border-radius: 0; padding: 2px 12px; margin: 0; text-align: left; }"
-                "QPushButton:hover { background: transparent; }"
-                "QPushButton:pressed { background: transparent; }"
-                "QPushButton:disabled { background: transparent; color: #6E6F78; }"
-            )
-            try:
-                from PyQt6.QtWidgets import QSizePolicy
-                hotkey_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            except Exception:
-                pass
-            try:
-                row_h = self.script_table.verticalHeader().defaultSectionSize()
-                hotkey_btn.setMaximumHeight(int(row_h))
-                hotkey_btn.setMinimumHeight(0)
-                hotkey_btn.setContentsMargins(0, 0, 0, 0)
-            except Exception:
-                pass
-            hotkey_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            if raw_hotkey:
-                hotkey_btn.setToolTip(f"Current hotkey: {raw_hotkey}\nClick to change")
-            else:
-                hotkey_btn.setToolTip("No hotkey set. Click to change")
-            hotkey_btn.clicked.connect(
-                lambda checked, s=script['name']: self.hotkey_configuration_requested.emit(s)
-            )
-            # Make the entire cell act as the button (fills cell, no rounded edges)
-            self.script_table.setCellWidget(row, 3, hotkey_btn)
-        
-        # Normalize row heights based on header default
-        try:
-            vh = self.script_table.verticalHeader()
-            desired = max(vh.minimumSectionSize(), int(vh.defaultSectionSize()))
-            for r in range(self.script_table.rowCount()):
-                self.script_table.setRowHeight(r, desired)
-        except Exception:
-            pass
+            self._on_action_clicked(name_key, is_external=bool(script['is_external']))
+        elif col == ScriptTableModel.COL_DISPLAY_NAME:
+            self._on_set_custom_name(script['name'])
+        elif col == ScriptTableModel.COL_HOTKEY:
+            self.hotkey_configuration_requested.emit(script['name'])
 
-        # Apply disabled styling for built-in scripts
-        for row, script in enumerate(self._script_data):
-            self._apply_row_disabled_style(row, script.get('is_disabled', False))
-
-    def _apply_row_disabled_style(self, row: int, disabled: bool):
-        """Gray out and disable interactive widgets for disabled scripts (built-in only)."""
-        # Action button stays enabled (to allow re-enabling)
-        # Display name button
-        display_btn = self.script_table.cellWidget(row, 1)
-        if isinstance(display_btn, QPushButton):
-            display_btn.setEnabled(not disabled)
-        # Filename item
-        file_item = self.script_table.item(row, 2)
-        if isinstance(file_item, QTableWidgetItem):
-            file_item.setForeground(Qt.GlobalColor.gray if disabled else Qt.GlobalColor.black)
-        # Hotkey button
-        hotkey_btn = self.script_table.cellWidget(row, 3)
-        if isinstance(hotkey_btn, QPushButton):
-            hotkey_btn.setEnabled(not disabled)
+    def eventFilter(self, obj, event):
+        """Give the scripts and presets tables keyboard equivalents of their clicks."""
+        if event.type() == QEvent.Type.KeyPress:
+            if obj is self.script_table and event.key() in _ACTIVATION_KEYS:
+                index = self.script_table.currentIndex()
+                if index.isValid():
+                    self._on_script_cell_clicked(index)
+                    return True
+            elif obj is self.preset_table:
+                action = _PRESET_KEY_ACTIONS.get(event.key())
+                index = self.preset_table.currentIndex()
+                if action is not None and index.isValid():
+                    self._on_preset_action_clicked(index.row(), action)
+                    return True
+        return super().eventFilter(obj, event)
 
     def _on_action_clicked(self, name_key: str, is_external: bool):
         """Handle the action button: remove external or toggle built-in enable/disable."""
@@ -645,133 +1032,51 @@ class SettingsView(QDialog):
             self.external_script_remove_requested.emit(name_key)
             return
         # Built-in: look up current disabled state and toggle
-        current = None
-        for s in self._script_data:
-            if s.get('original_display_name', s.get('display_name')) == name_key:
-                current = s
-                break
+        row = self._row_by_original_name.get(name_key, -1)
+        current = self._script_data[row] if row >= 0 else None
         current_disabled = bool(current.get('is_disabled', False)) if current else False
         # Clicking toggles disabled state; enabled value equals current disabled state
         # If currently disabled -> enable (True); if enabled -> disable (False)
         self.script_toggled.emit(name_key, current_disabled)
     
-    def _update_preset_script_combo(self):
-        """Update the script combo box in presets tab"""
-        current = self.preset_script_combo.currentText()
-        self.preset_script_combo.clear()
-        
-        # Add scripts that have arguments
-        for script in self._script_data:
-            if script.get('has_arguments'):
-                self.preset_script_combo.addItem(script['display_name'])
-        
-        # Try to restore selection
-        if current:
-            index = self.preset_script_combo.findText(current)
-            if index >= 0:
-                self.preset_script_combo.setCurrentIndex(index)
+    def _update_preset_script_combo(self, refresh_table: bool = False):
+        """Update the script combo box in presets tab.
+
+        The presets table is refreshed once if the selected script changed
+        (or when refresh_table is set), not for every intermediate selection
+        the combo passes through while it is repopulated.
+        """
+        combo = self.preset_script_combo
+        if combo is None:
+            # Presets tab not built yet; it fills the combo when first shown
+            return
+        current = combo.currentText()
+        # Scripts that have arguments
+        names = [
+            script['display_name'] for script in self._script_data if script.get('has_arguments')
+        ]
+        if names != [combo.itemText(i) for i in range(combo.count())]:
+            with QSignalBlocker(combo):
+                combo.clear()
+                combo.addItems(names)
+                
+                # Try to restore selection
+                if current:
+                    index = combo.findText(current)
+                    if index >= 0:
+                        combo.setCurrentIndex(index)
+        
+        selected = combo.currentText()
+        if refresh_table or selected != current:
+            self._on_preset_script_changed(selected)
     
-    def _refresh_preset_table(self, presets: Dict[str, Any]):
+    def _refresh_preset_table(self, presets: Dict[str, Any], script_name: Optional[str] = None):
         """Refresh the presets table display to mirror Scripts tab styling."""
-        # Normalize None to empty dict
-        presets = presets or {}
+        self.preset_model.set_presets(presets, script_name)
 
-        # Reset contents
-        self.preset_table.clearContents()
-        rows = len(presets)
-        self.preset_table.setRowCount(rows)
-
-        # Stable ordering by preset name
-        for row, preset_name in enumerate(sorted(presets.keys(), key=lambda s: s.lower())):
-            args = presets.get(preset_name, {}) or {}
-
-            # ACTIONS cell: Edit + Delete buttons
-            actions_widget = QWidget()
-            try:
-                actions_widget.setStyleSheet("background: transparent; border: none; margin: 0; padding: 0;")
-            except Exception:
-                pass
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(0, 0, 0, 0)
-            actions_layout.setSpacing(0)
-            try:
-                actions_layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            except Exception:
-                pass
-
-            edit_btn = QPushButton("Edit")
-            edit_btn.setFlat(True)
-            edit_btn.setStyleSheet(
-                "QPushButton { border: none; border-radius: 0; padding: 0px 12px; margin: 0; background: transparent; }"
-                "QPushButton:hover { background-color: #5A5B64; }"
-            )
-            try:
-                from PyQt6.QtWidgets import QSizePolicy
-                edit_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            except Exception:
-                pass
-            try:
-                row_h = self.preset_table.verticalHeader().defaultSectionSize()
-                edit_btn.setMaximumHeight(int(row_h))
-                edit_btn.setMinimumHeight(0)
-                edit_btn.setContentsMargins(0, 0, 0, 0)
-            except Exception:
-                pass
-            edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            edit_btn.setToolTip(f"Edit preset '{preset_name}'")
-            edit_btn.clicked.connect(lambda checked=False, p=preset_name: self._on_edit_preset_named(p))
-            actions_layout.addWidget(edit_btn)
-
-            del_btn = QPushButton("Delete")
-            del_btn.setFlat(True)
-            del_btn.setStyleSheet(
-                "QPushButton { border: none; border-radius: 0; padding: 0px 12px; margin: 0; background: transparent; }"
-                "QPushButton:hover { background-color: #5A5B64; }"
-            )
-            try:
-                from PyQt6.QtWidgets import QSizePolicy
-                del_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            except Exception:
-                pass
-            try:
-                row_h = self.preset_table.verticalHeader().defaultSectionSize()
-                del_btn.setMaximumHeight(int(row_h))
-                del_btn.setMinimumHeight(0)
-                del_btn.setContentsMargins(0, 0, 0, 0)
-            except Exception:
-                pass
-            del_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            del_btn.setToolTip(f"Delete preset '{preset_name}'")
-            del_btn.clicked.connect(lambda checked=False, p=preset_name: self._on_delete_preset_named(p))
-            actions_layout.addWidget(del_btn)
-            # No stretch; both buttons fill the entire cell horizontally and vertically
-            self.preset_table.setCellWidget(row, 0, actions_widget)
-
-            # PRESET NAME cell
-            name_item = QTableWidgetItem(preset_name)
-            name_item.setTextAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-            name_item.setToolTip(f"Preset: {preset_name}")
-            # Store raw preset name for retrieval
-            name_item.setData(Qt.ItemDataRole.UserRole, preset_name)
-            self.preset_table.setItem(row, 1, name_item)
-
-            # ARGUMENTS cell (compact, tooltip shows full list)
-            args_pairs = [f"{k}={v}" for k, v in args.items()]
-            args_str = ", ".join(args_pairs)
-            args_item = QTableWidgetItem(args_str)
-            args_item.setTextAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-            if args_pairs:
-                args_item.setToolTip("\n".join(args_pairs))
-            self.preset_table.setItem(row, 2, args_item)
-
-        # Normalize row heights based on header default
-        try:
-            p_vh = self.preset_table.verticalHeader()
-            p_desired = max(p_vh.minimumSectionSize(), int(p_vh.defaultSectionSize()))
-            for r in range(self.preset_table.rowCount()):
-                self.preset_table.setRowHeight(r, p_desired)
-        except Exception:
-            pass
+    def _apply_preset_changes(self, presets: Dict[str, Any]):
+        """Patch the presets table for an edit/add/delete instead of rebuilding it."""
+        self.preset_model.update_presets(presets)
     
     # UI event handlers
     
@@ -780,20 +1085,19 @@ class SettingsView(QDialog):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Python Script",
-            "",
+            SettingsView._last_script_dir,
             "Python Scripts (*.py)"
         )
         
         if file_path:
+            SettingsView._last_script_dir = os.path.dirname(file_path)
             # Emit signal with file path
             self.external_script_add_requested.emit(file_path)
     
     def _on_set_custom_name(self, script_name: str):
         """Handle set custom name button"""
-        current_name = next(
-            (s.get('custom_name') for s in self._script_data if s['name'] == script_name),
-            script_name
-        )
+        row = self._find_row(script_name)
+        current_name = self._script_data[row].get('custom_name') if row >= 0 else script_name
         
         new_name, ok = QInputDialog.getText(
             self,
@@ -803,64 +1107,55 @@ class SettingsView(QDialog):
         )
         
         if ok:
+            # The controller skips names that would not change anything
             self.custom_name_changed.emit(script_name, new_name)
     
     def _on_preset_script_changed(self, script_name: str):
         """Handle preset script selection change"""
+        self._preset_script = script_name
+        if self._defer_until_shown(self._presets_page, self._reload_preset_table):
+            return
         if script_name and script_name in self._preset_data:
-            self._refresh_preset_table(self._preset_data[script_name])
+            self._refresh_preset_table(self._preset_data[script_name], script_name)
         else:
             self._refresh_preset_table({})
     
+    def _reload_preset_table(self):
+        """Rebuild the presets table for the selected script."""
+        self._on_preset_script_changed(self._preset_script)
+    
     def _on_add_preset(self):
         """Handle add preset button"""
-        script_name = self.preset_script_combo.currentText()
+        script_name = self._preset_script
         if script_name:
             self.add_preset_requested.emit(script_name)
     
-    def _on_edit_preset(self):
-        """Handle edit preset button"""
-        # Prefer selected row; fallback to first row
-        row = self.preset_table.currentRow()
-        if row < 0 and self.preset_table.rowCount() > 0:
-            row = 0
-        if row >= 0:
-            name_item = self.preset_table.item(row, 1)
-            if isinstance(name_item, QTableWidgetItem):
-                preset_name = name_item.data(Qt.ItemDataRole.UserRole) or name_item.text()
-                script_name = self.preset_script_combo.currentText()
-                self.edit_preset_requested.emit(script_name, preset_name)
-    
-    def _on_delete_preset(self):
-        """Handle delete preset button"""
-        # Delete the currently selected preset
-        row = self.preset_table.currentRow()
-        if row < 0 and self.preset_table.rowCount() > 0:
-            row = 0
-        if row >= 0:
-            name_item = self.preset_table.item(row, 1)
-            if isinstance(name_item, QTableWidgetItem):
-                preset_name = name_item.data(Qt.ItemDataRole.UserRole) or name_item.text()
-                script_name = self.preset_script_combo.currentText()
-                
-                reply = QMessageBox.question(
-                    self,
-                    "Delete Preset",
-                    f"Delete preset '{preset_name}'?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-                
-                if reply == QMessageBox.StandardButton.Yes:
-                    self.preset_deleted.emit(script_name, preset_name)
+    def _on_preset_double_clicked(self, index: QModelIndex):
+        """Edit the double-clicked preset (the ACTION cell handles its own clicks)."""
+        if index.column() == PresetTableModel.COL_ACTION:
+            return
+        preset_name = self.preset_model.preset_at(index.row())
+        if preset_name is not None:
+            self._on_edit_preset_named(preset_name)
 
     # Named action helpers for per-row buttons
+    def _on_preset_action_clicked(self, row: int, action: str):
+        """Dispatch an Edit/Delete click from the ACTION cell."""
+        preset_name = self.preset_model.preset_at(row)
+        if preset_name is None:
+            return
+        if action == "Edit":
+            self._on_edit_preset_named(preset_name)
+        elif action == "Delete":
+            self._on_delete_preset_named(preset_name)
+
     def _on_edit_preset_named(self, preset_name: str):
-        script_name = self.preset_script_combo.currentText()
+        script_name = self._preset_script
         if script_name and preset_name:
             self.edit_preset_requested.emit(script_name, preset_name)
 
     def _on_delete_preset_named(self, preset_name: str):
-        script_name = self.preset_script_combo.currentText()
+        script_name = self._preset_script
         if not (script_name and preset_name):
             return
         reply = QMessageBox.question(
@@ -874,7 +1169,7 @@ class SettingsView(QDialog):
     
     def _on_auto_generate_presets(self):
         """Handle auto-generate presets button"""
-        script_name = self.preset_script_combo.currentText()
+        script_name = self._preset_script
         if script_name:
             self.auto_generate_presets_requested.emit(script_name)
     
@@ -8,14 +8,24 @@ business logic.
 import logging
 import gc
 import weakref
+from functools import partial
 from typing import Optional, Dict, Any, List
-from PyQt6.QtWidgets import (QSystemTrayIcon, QMenu, QWidget)
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer, Qt
+from PyQt6.QtWidgets import (QSystemTrayIcon, QMenu, QWidget, QApplication)
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer, Qt
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QBrush, QPen, QCursor, QAction
 
 logger = logging.getLogger('Views.Tray')
 
 
+def _menu_layout(items: List[Dict[str, Any]]) -> tuple:
+    """Item types of a menu structure, nested for submenus"""
+    return tuple(
+        ('submenu', _menu_layout(item.get('items', [])))
+        if item.get('type', 'action') == 'submenu' else item.get('type', 'action')
+        for item in items
+    )
+
+
 class TrayView(QObject):
     """
     View component for system tray interactions.
@@ -41,6 +51,12 @@ class TrayView(QObject):
         self._menu_actions = []  # List to track QAction objects
         self._submenus = []  # List to track QMenu objects
         self._menu_update_count = 0  # Track updates for periodic cleanup
+        self._menu_structure = None  # Structure the current menu was built from
+        self._menu_entries = []  # (item data, QAction in context menu) per script item
+        self._title_action = None
+        self._bottom_separator = None
+        self._pending_menu_structure = None  # Latest structure not yet built
+        self._unpopulated_submenus = {}  # QMenu -> items to add when first shown
         
         # Create tray icon
         self.tray_icon = QSystemTrayIcon(parent)
@@ -54,6 +70,7 @@ class TrayView(QObject):
         
         # Connect signals
         self.tray_icon.activated.connect(self._on_tray_activated)
+        self.context_menu.aboutToShow.connect(self._apply_pending_menu_structure)
         self.tray_icon.setContextMenu(self.context_menu)
         
         logger.info("TrayView initialized")
@@ -86,92 +103,255 @@ class TrayView(QObject):
         """Check if system supports tray notifications"""
         return self.tray_icon.supportsMessages()
     
+    @pyqtSlot(dict)
     def update_menu_structure(self, menu_structure: Dict[str, Any]):
-        """Update the menu structure based on provided data"""
+        """Update the menu structure based on provided data.
+        
+        While the menu is closed the menu is built on the next event loop
+        turn from the latest structure, so a burst of updates builds once.
+        Native tray menus may never emit aboutToShow, so the build must not
+        wait for it; only preset submenus are filled in lazily.
+        """
+        if self.context_menu.isVisible():
+            self._pending_menu_structure = None
+            self._build_menu(menu_structure)
+            return
+        if self._pending_menu_structure is None:
+            QTimer.singleShot(0, self._apply_pending_menu_structure)
+        self._pending_menu_structure = menu_structure
+    
+    @pyqtSlot()
+    def _apply_pending_menu_structure(self):
+        """Build the menu from the latest structure not yet applied"""
+        menu_structure = self._pending_menu_structure
+        if menu_structure is None:
+            return
+        self._pending_menu_structure = None
+        self._build_menu(menu_structure)
+    
+    def _build_menu(self, menu_structure: Dict[str, Any]):
+        """Bring the context menu up to date with a menu structure"""
+        if menu_structure == self._menu_structure:
+            logger.debug("Menu structure unchanged, skipping rebuild")
+            return
+        
         logger.debug("Updating menu structure...")
         
         try:
-            # Perform deep cleanup of existing menu objects
-            self._cleanup_menu_objects()
-            
-            # Clear existing menu
-            self.context_menu.clear()
-            
-            # Reset tracking lists
-            self._menu_actions = []
-            self._submenus = []
+            menu_items = menu_structure.get('items', [])
+            if self._title_action is None:
+                self._build_menu_frame()
             
-            # Add title (clickable)
             title_text = menu_structure.get('title', 'Desktop Utilities')
-            title_action = QAction(title_text, self.context_menu)
-            title_action.triggered.connect(self.title_clicked.emit)
-            self.context_menu.addAction(title_action)
-            self._menu_actions.append(title_action)
-            
-            # Add separator
-            self.context_menu.addSeparator()
-            
-            # Add menu items
-            menu_items = menu_structure.get('items', [])
-            for item_data in menu_items:
-                self._add_menu_item(self.context_menu, item_data)
+            if self._title_action.text() != title_text:
+                self._title_action.setText(title_text)
             
-            # Add bottom separator and exit
-            self.context_menu.addSeparator()
-            exit_action = QAction("Exit", self.context_menu)
-            exit_action.triggered.connect(self.exit_requested.emit)
-            self.context_menu.addAction(exit_action)
-            self._menu_actions.append(exit_action)
+            removed = self._sync_menu_items(menu_items)
+            self._menu_structure = menu_structure
             
             logger.debug(f"Menu updated with {len(menu_items)} items")
             
-            # Perform periodic aggressive cleanup
-            self._menu_update_count += 1
-            if self._menu_update_count % 10 == 0:
-                self._perform_aggressive_cleanup()
+            # Perform periodic aggressive cleanup, counting only updates that
+            # deleted menu objects; run it from the event loop rather than
+            # nested inside a menu's aboutToShow
+            if removed:
+                self._menu_update_count += 1
+                if self._menu_update_count % 10 == 0:
+                    QTimer.singleShot(0, self._perform_aggressive_cleanup)
             
         except Exception as e:
             logger.error(f"Error updating menu structure: {e}")
     
-    def _add_menu_item(self, parent_menu: QMenu, item_data: Dict[str, Any]):
-        """Add a menu item based on item data"""
+    def _build_menu_frame(self):
+        """Create the fixed parts of the menu: title, separators and Exit"""
+        # Perform deep cleanup of existing menu objects
+        self._cleanup_menu_objects()
+        
+        # Clear existing menu
+        self.context_menu.clear()
+        
+        # Reset tracking lists
+        self._menu_actions = []
+        self._submenus = []
+        self._menu_entries = []
+        
+        # Add title (clickable)
+        title_action = QAction('Desktop Utilities', self.context_menu)
+        title_action.triggered.connect(self.title_clicked.emit)
+        self.context_menu.addAction(title_action)
+        self._menu_actions.append(title_action)
+        self._title_action = title_action
+        
+        # Add separator
+        self.context_menu.addSeparator()
+        
+        # Add bottom separator and exit; script items go between the separators
+        self._bottom_separator = self.context_menu.addSeparator()
+        exit_action = QAction("Exit", self.context_menu)
+        exit_action.triggered.connect(self.exit_requested.emit)
+        self.context_menu.addAction(exit_action)
+        self._menu_actions.append(exit_action)
+    
+    def _sync_menu_items(self, menu_items: List[Dict[str, Any]]) -> bool:
+        """Make the script items match menu_items, reusing existing menu objects.
+        
+        Items are matched by their 'key'. A matched item with the same layout
+        is updated in place; everything else is created or removed. A menu
+        whose whole layout is unchanged is updated position by position.
+        Returns True if any menu objects were deleted.
+        """
+        old_items = [item_data for item_data, _ in self._menu_entries]
+        if _menu_layout(menu_items) == _menu_layout(old_items):
+            for (old_data, action), item_data in zip(self._menu_entries, menu_items):
+                self._update_menu_item(old_data, action, item_data)
+            self._menu_entries = [(item_data, action) for (_, action), item_data
+                                  in zip(self._menu_entries, menu_items)]
+            return False
+        
+        old_by_key = {}
+        stale = []
+        for item_data, action in self._menu_entries:
+            key = item_data.get('key')
+            if key is None or key in old_by_key:
+                stale.append(action)
+            else:
+                old_by_key[key] = (item_data, action)
+        
+        entries = []
+        for item_data in menu_items:
+            key = item_data.get('key')
+            old = old_by_key.pop(key, None) if key is not None else None
+            if old is not None and _menu_layout([old[0]]) == _menu_layout([item_data]):
+                self._update_menu_item(old[0], old[1], item_data)
+                action = old[1]
+            else:
+                if old is not None:
+                    stale.append(old[1])
+                action = self._add_menu_item(self.context_menu, item_data, self._bottom_separator)
+            entries.append((item_data, action))
+        stale.extend(action for _, action in old_by_key.values())
+        
+        for action in stale:
+            self._remove_menu_entry(action)
+        
+        # Restore the new order if reused items ended up out of place
+        actions = [action for _, action in entries]
+        wanted = set(actions)
+        if [a for a in self.context_menu.actions() if a in wanted] != actions:
+            for action in actions:
+                self.context_menu.insertAction(self._bottom_separator, action)
+        self._menu_entries = entries
+        return bool(stale)
+    
+    def _update_menu_item(self, old_data: Dict[str, Any], action: QAction,
+                          item_data: Dict[str, Any]):
+        """Apply item_data to an item built from old_data with the same layout.
+        
+        Only labels, enabled states and action data that differ are touched.
+        """
         item_type = item_data.get('type', 'action')
+        text = self._menu_item_text(item_data)
+        
+        if item_type == 'action':
+            if action.text() != text:
+                action.setText(text)
+            enabled = item_data.get('enabled', True)
+            if action.isEnabled() != enabled:
+                action.setEnabled(enabled)
+            old_action_data = old_data.get('data') if old_data.get('enabled', True) else None
+            action_data = item_data.get('data') if enabled else None
+            if old_action_data != action_data:
+                if old_action_data:
+                    action.triggered.disconnect()
+                if action_data:
+                    action.triggered.connect(partial(self._on_menu_action, action_data))
+        
+        elif item_type == 'submenu':
+            submenu = action.menu()
+            if submenu.title() != text:
+                submenu.setTitle(text)
+            if submenu in self._unpopulated_submenus:
+                self._unpopulated_submenus[submenu] = item_data.get('items', [])
+                return
+            for old_sub, sub_action, sub_data in zip(old_data.get('items', []),
+                                                     submenu.actions(),
+                                                     item_data.get('items', [])):
+                self._update_menu_item(old_sub, sub_action, sub_data)
+    
+    def _remove_menu_entry(self, action: QAction):
+        """Remove a top-level script item and delete its menu objects"""
+        self.context_menu.removeAction(action)
+        submenu = action.menu()
+        if submenu is not None:
+            # The submenu owns its actions and its menu action
+            for sub_action in submenu.actions():
+                if sub_action in self._menu_actions:
+                    self._menu_actions.remove(sub_action)
+            if submenu in self._submenus:
+                self._submenus.remove(submenu)
+            self._unpopulated_submenus.pop(submenu, None)
+            submenu.deleteLater()
+        else:
+            if action in self._menu_actions:
+                self._menu_actions.remove(action)
+            action.deleteLater()
+    
+    @staticmethod
+    def _menu_item_text(item_data: Dict[str, Any]) -> str:
+        """Label shown for a menu item"""
         text = item_data.get('text', '')
+        # Running scripts are shown with a special indicator
+        if item_data.get('type', 'action') == 'action' and item_data.get('is_running', False):
+            text = f"⏳ {text} (Running...)"
+        return text
+    
+    def _add_menu_item(self, parent_menu: QMenu, item_data: Dict[str, Any],
+                       before: Optional[QAction] = None) -> QAction:
+        """Add a menu item based on item data; returns its action in parent_menu"""
+        item_type = item_data.get('type', 'action')
+        text = self._menu_item_text(item_data)
         enabled = item_data.get('enabled', True)
         
-        if item_type == 'action':
-            # Check if this is a running script (show with special indicator)
-            is_running = item_data.get('is_running', False)
-            if is_running:
-                text = f"⏳ {text} (Running...)"
+        if item_type == 'submenu':
+            submenu = QMenu(text, parent_menu)
+            self._submenus.append(submenu)
+            
+            # Submenu items are added when the submenu is first opened
+            self._unpopulated_submenus[submenu] = item_data.get('items', [])
+            submenu.aboutToShow.connect(partial(self._populate_submenu, submenu))
+            
+            # Add submenu to parent
+            action = submenu.menuAction()
+            
+        elif item_type == 'separator':
+            action = QAction(parent_menu)
+            action.setSeparator(True)
             
+        else:
             action = QAction(text, parent_menu)
             action.setEnabled(enabled)
             
             # Connect action if data is provided
             action_data = item_data.get('data')
             if action_data and enabled:
-                action.triggered.connect(
-                    lambda checked, data=action_data: self.menu_action_triggered.emit(data)
-                )
+                action.triggered.connect(partial(self._on_menu_action, action_data))
             
-            parent_menu.addAction(action)
             self._menu_actions.append(action)
-            
-        elif item_type == 'submenu':
-            submenu = QMenu(text, parent_menu)
-            self._submenus.append(submenu)
-            
-            # Add submenu items
-            submenu_items = item_data.get('items', [])
-            for subitem_data in submenu_items:
-                self._add_menu_item(submenu, subitem_data)
-            
-            # Add submenu to parent
-            parent_menu.addMenu(submenu)
-            
-        elif item_type == 'separator':
-            parent_menu.addSeparator()
+        
+        parent_menu.insertAction(before, action)
+        return action
+    
+    def _populate_submenu(self, submenu: QMenu):
+        """Add a submenu's items the first time it is about to show"""
+        submenu_items = self._unpopulated_submenus.pop(submenu, None)
+        if submenu_items is None:
+            return
+        for subitem_data in submenu_items:
+            self._add_menu_item(submenu, subitem_data)
+    
+    def _on_menu_action(self, action_data: Dict[str, Any], checked: bool = False):
+        """Forward the data of a triggered menu action"""
+        self.menu_action_triggered.emit(action_data)
     
     def _create_tray_icon(self):
         """Create the tray icon programmatically"""
@@ -204,12 +384,12 @@ class TrayView(QObject):
         except Exception as e:
             logger.error(f"Error creating tray icon: {e}")
             # Fallback to system icon
-            from PyQt6.QtWidgets import QApplication
             app = QApplication.instance()
             if app:
                 self.tray_icon.setIcon(app.style().standardIcon(
                     app.style().StandardPixmap.SP_ComputerIcon))
     
+    @pyqtSlot(QSystemTrayIcon.ActivationReason)
     def _on_tray_activated(self, reason):
         """Handle tray icon activation"""
         # Show context menu on right-click (Context) and single left-click (Trigger)
@@ -224,15 +404,9 @@ class TrayView(QObject):
     def _cleanup_menu_objects(self):
         """Explicitly clean up menu objects to prevent accumulation."""
         try:
-            # Disconnect and delete all tracked actions
+            # Delete all tracked actions; Qt drops their connections with them,
+            # so there is nothing to disconnect (disabled ones have none anyway)
             for action in self._menu_actions:
-                try:
-                    # Disconnect all signals
-                    action.triggered.disconnect()
-                except:
-                    pass  # Might already be disconnected
-                
-                # Schedule for deletion
                 action.deleteLater()
             
             # Delete all submenus
@@ -243,6 +417,10 @@ class TrayView(QObject):
             # Clear tracking lists
             self._menu_actions.clear()
             self._submenus.clear()
+            self._menu_entries.clear()
+            self._unpopulated_submenus.clear()
+            self._title_action = None
+            self._bottom_separator = None
             
             logger.debug("Menu objects cleaned up")
             
@@ -253,7 +431,6 @@ class TrayView(QObject):
         """Perform aggressive memory cleanup periodically."""
         try:
             # Force Qt to process deleteLater events
-            from PyQt6.QtWidgets import QApplication
             app = QApplication.instance()
             if app:
                 app.processEvents()
@@ -273,6 +450,8 @@ class TrayView(QObject):
         
         # Clear the menu
         self.context_menu.clear()
+        self._menu_structure = None
+        self._pending_menu_structure = None
         
         # Hide tray icon
         self.tray_icon.hide()